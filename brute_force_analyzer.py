@@ -0,0 +1,175 @@
+"""
+Masterplan Tycoon Brute Force Save Analyzer
+
+Author: Patrick Snyder
+
+Description:
+This script digs through the raw save file looking for anything interesting that the
+dashboard doesn't surface: what the missions are still asking for, which resources are
+being produced in bulk, whether any production ratios look out of whack, and which
+buildings have been grinding away the longest.
+
+Unlike the dashboard (masterplan_analysis.py) this is a console script. Run it and read
+the printout. It loads the same save file from the game's save directory
+(`C:\\Users\\<username>\\AppData\\LocalLow\\Bureau Bravin\\Masterplan Tycoon`).
+
+Usage:
+- Run brute_force_analyzer.py in python
+- Read the report sections printed to the console
+- If the save file isn't found, update the path in load_save_file below just like
+    in masterplan_analysis.py
+
+"""
+
+import sys
+
+import numpy as np
+import pandas as pd
+
+from data_io import load_save_file
+
+# Pairs of (product, ingredient) worth keeping an eye on. Built once at import time
+# so analyze_resource_ratios doesn't rebuild the list on every call.
+INTERESTING_RATIOS = [
+    ('planks', 'timber', 'sawmill throughput'),
+    ('bricks', 'clay', 'brickworks throughput'),
+    ('flour', 'wheat', 'mill supply'),
+    ('bread', 'flour', 'bakery supply'),
+    ('steel', 'iron', 'smelter supply'),
+    ('tools', 'steel', 'workshop supply'),
+]
+
+# Turn the node list into a DataFrame so the analysis below can use vectorized column
+# operations instead of walking the node dicts one at a time
+def build_nodes_dataframe(save_data):
+    return pd.DataFrame(save_data.get('Nodes', []))
+
+# Figure out what the missions still need delivered
+def analyze_mission_requirements(save_data):
+    print("=== MISSION REQUIREMENTS ===")
+
+    nodes_df = build_nodes_dataframe(save_data)
+    if nodes_df.empty or 'ConfigID' not in nodes_df.columns:
+        print("No nodes found in save data.")
+        return
+
+    # Vectorized filter: one C-level substring pass over the whole column instead of
+    # lowercasing and checking each ConfigID in Python
+    mission_mask = nodes_df['ConfigID'].str.contains('mission', case=False, regex=False, na=False)
+    mission_nodes_df = nodes_df[mission_mask]
+
+    print(f"Found {len(mission_nodes_df)} mission nodes")
+
+    if 'Construction' not in mission_nodes_df.columns:
+        return
+
+    # Flatten the nested Construction.IncomeStorage dicts into columns and aggregate,
+    # so the per-resource totals come out of one groupby instead of a Python loop
+    construction = pd.json_normalize(mission_nodes_df['Construction'].dropna())
+    storage = construction.filter(regex=r'^IncomeStorage\.')
+    if storage.empty:
+        print("No mission storage requirements found.")
+        return
+
+    # Column names look like 'IncomeStorage.stuff.fish' -- keep just the resource name
+    storage.columns = [col.rsplit('.', 1)[-1] for col in storage.columns]
+    total_requirements = storage.sum().groupby(level=0).sum().sort_values(ascending=False)
+
+    out = ["Total resources requested by missions:"]
+    for resource, amount in total_requirements.items():
+        out.append(f"  {resource}: {amount:,.0f}")
+    sys.stdout.write('\n'.join(out) + '\n')
+
+# Tally up everything sitting in output storage across the whole map
+def analyze_production_chains(save_data):
+    print("\n=== PRODUCTION CHAINS ===")
+
+    resource_production = {}
+
+    for node in save_data.get('Nodes', []):
+        construction = node.get('Construction', {})
+        outcome = construction.get('OutcomeStorage', {})
+        for item, amount in outcome.items():
+            resource = item.split('.')[-1]
+            resource_production[resource] = resource_production.get(resource, 0) + amount
+
+    # Buffer the per-resource lines and emit them in one write instead of taking the
+    # stdout lock and flushing once per resource
+    out = [f"Found {len(resource_production)} distinct resources in output storage"]
+    p = out.append
+
+    # A plain sorted list of (resource, total) pairs is all this report needs; boxing
+    # it into a DataFrame just to iterrows back out would cost more than the sort
+    for resource, total_production in sorted(resource_production.items(), key=lambda kv: kv[1], reverse=True):
+        if total_production > 5000:
+            flag = "  <-- VERY HIGH volume"
+        elif total_production > 1000:
+            flag = "  <-- high volume"
+        else:
+            flag = ""
+        p(f"  {resource}: {total_production:,.0f}{flag}")
+
+    sys.stdout.write('\n'.join(out) + '\n')
+    return resource_production
+
+# Compare production volumes of resources that feed each other
+def analyze_resource_ratios(resource_production):
+    print("\n=== RESOURCE RATIOS ===")
+
+    # Bind the lookup once, pull the pair totals into two arrays, and let numpy do
+    # the division and flagging in one pass instead of branching per pair
+    rp = resource_production.get
+    nums = np.array([rp(product, 0) for product, _, _ in INTERESTING_RATIOS], dtype=np.float64)
+    dens = np.array([rp(ingredient, 0) for _, ingredient, _ in INTERESTING_RATIOS], dtype=np.float64)
+
+    ratios = np.where(dens > 0, nums / np.where(dens == 0, 1, dens), np.nan)
+    notes = np.select(
+        [ratios > 10, ratios > 3, ratios < 0.3],
+        ['MASSIVE overproduction', 'overproducing', 'underproducing'],
+        default='ok'
+    )
+
+    out = []
+    for (resource1, resource2, label), ratio, note in zip(INTERESTING_RATIOS, ratios, notes):
+        if np.isnan(ratio):
+            out.append(f"  {resource1}/{resource2} ({label}): no {resource2} produced")
+        else:
+            out.append(f"  {resource1}/{resource2} ({label}): {ratio:.2f} ({note})")
+    sys.stdout.write('\n'.join(out) + '\n')
+
+# Spot the buildings that have been running the longest
+def find_interesting_buildings(save_data):
+    print("\n=== LONG-RUNNING BUILDINGS ===")
+
+    nodes = save_data.get('Nodes', [])
+    config_ids = [node.get('ConfigID', 'unknown') for node in nodes]
+
+    # Pull the uptimes into one numpy array so the threshold filter and sort run as
+    # array operations instead of a per-node Python loop
+    uptime_hours = np.fromiter(
+        (node.get('Construction', {}).get('ProductionUptime', 0) for node in nodes),
+        dtype=np.float64,
+        count=len(nodes)
+    ) / 3600.0
+
+    hits = np.where(uptime_hours > 100)[0]
+    hits = hits[np.argsort(uptime_hours[hits])[::-1]]
+
+    out = [f"Found {len(hits)} buildings with over 100 hours of production uptime"]
+    for idx in hits:
+        out.append(f"  {config_ids[idx]}: {uptime_hours[idx]:,.1f} hours")
+    sys.stdout.write('\n'.join(out) + '\n')
+
+def main():
+    save_data = load_save_file()
+    if not save_data:
+        print("No save file found.")
+        return
+
+    analyze_mission_requirements(save_data)
+    resource_production = analyze_production_chains(save_data)
+    analyze_resource_ratios(resource_production)
+    find_interesting_buildings(save_data)
+
+if __name__ == "__main__":
+    main()
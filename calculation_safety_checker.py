@@ -0,0 +1,91 @@
+"""
+Masterplan Tycoon Calculation Safety Checker
+
+Author: Patrick Snyder
+
+Description:
+Guard rails for the production calculator. A calculated plan that asks for ten
+thousand sawmills is almost certainly a data problem, not a real answer, so the
+checker learns what "normal" looks like from an actual playthrough export
+(game_data_save0.json) and flags calculated building counts that run far past it.
+
+No database connection needed here -- the bounds come straight from the save export.
+
+Usage:
+- Export a save as game_data_save0.json (see the save explorer scripts)
+- Create a CalculationSafetyChecker and call check_building_count per calculated building
+
+"""
+
+import json
+from collections import Counter
+
+# Same optional streaming dependency as data_io: stream just the node names when
+# ijson is around, fall back to loading the whole export when it isn't
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+SAVE_FILE = 'game_data_save0.json'
+
+class CalculationSafetyChecker:
+    def __init__(self, save_file_path=SAVE_FILE):
+        self.safety_bounds = {}
+        self.building_counts = {}
+        self.load_safety_bounds(save_file_path)
+
+    # Learn per-building-type counts from a real playthrough
+    def load_safety_bounds(self, save_file_path):
+        # Only the ConfigID of each node matters here, so stream just those out
+        # of the export instead of materializing the whole save graph to count
+        # them. Same Nodes/ConfigID schema the save explorer scripts read.
+        try:
+            if ijson is not None:
+                with open(save_file_path, 'rb') as f:
+                    self.building_counts = Counter(ijson.items(f, 'Nodes.item.ConfigID'))
+            else:
+                with open(save_file_path, 'r') as f:
+                    save_data = json.load(f)
+                self.building_counts = Counter(
+                    node.get('ConfigID', 'unknown') for node in save_data.get('Nodes', []))
+        except FileNotFoundError:
+            print(f"Save export not found at {save_file_path}; using default limits only")
+            self.building_counts = Counter()
+        else:
+            # A present-but-empty tally means the export's shape doesn't match;
+            # say so instead of silently running on default limits alone
+            if not self.building_counts:
+                print(f"No nodes counted in {save_file_path}; "
+                      f"check the export schema -- using default limits only")
+        self.safety_bounds = {
+            'building_type_multiplier': 3.0,   # allow up to 3x a real playthrough
+            'warning_threshold': 0.8,          # warn at 80% of the limit
+            'default_limit': 50,               # for types the playthrough never built
+        }
+
+        # Precompute every limit once so the hot check path is two dict lookups and
+        # two comparisons, with no float math per call
+        mult = self.safety_bounds['building_type_multiplier']
+        warn = self.safety_bounds['warning_threshold']
+        self._limits = {name: int(count * mult) for name, count in self.building_counts.items()}
+        self._warn = {name: int(limit * warn) for name, limit in self._limits.items()}
+        self._default_limit = self.safety_bounds['default_limit']
+        self._default_warn = int(self._default_limit * warn)
+
+    # The hard ceiling for one building type
+    def get_building_safety_limit(self, building_type):
+        return self._limits.get(building_type, self._default_limit)
+
+    # Check one calculated count against the learned bounds
+    def check_building_count(self, building_type, count):
+        limit = self._limits.get(building_type, self._default_limit)
+        warn_at = self._warn.get(building_type, self._default_warn)
+
+        if count > limit:
+            return {'status': 'error', 'limit': limit,
+                    'message': f"{building_type}: calculated {count} exceeds safety limit {limit}"}
+        if count >= warn_at:
+            return {'status': 'warning', 'limit': limit,
+                    'message': f"{building_type}: calculated {count} is close to safety limit {limit}"}
+        return {'status': 'ok', 'limit': limit, 'message': ''}
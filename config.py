@@ -0,0 +1,49 @@
+"""
+Masterplan Tycoon Shared Database Config
+
+Author: Patrick Snyder
+
+Description:
+One place for the clean database path and connection so the analysis scripts stop
+opening their own handles. The connection is memoized per process -- the first
+caller pays for the open and the page cache stays warm for everything after it --
+and tuned for the read-heavy query mix the validators and browsers run.
+
+"""
+
+import sqlite3
+from functools import lru_cache
+
+DB_FILE = 'masterplan_tycoon_clean.db'
+
+# Covering indexes for the joins the analysis scripts hammer: building_id filters
+# with resource_id joins on every relationship table, plus the map-id joins.
+# Each is keyed by the table it needs, so a database built before the
+# relationship tables exist (the base pipeline alone) still opens fine -- the
+# index appears on the first connection after its table does.
+_INDEX_STATEMENTS = (
+    ('building_inputs', 'CREATE INDEX IF NOT EXISTS idx_bi_bid_rid ON building_inputs(building_id, resource_id)'),
+    ('building_outputs', 'CREATE INDEX IF NOT EXISTS idx_bo_bid_rid ON building_outputs(building_id, resource_id)'),
+    ('building_construction', 'CREATE INDEX IF NOT EXISTS idx_bc_bid_rid ON building_construction(building_id, resource_id)'),
+    ('building_maintenance', 'CREATE INDEX IF NOT EXISTS idx_bm_bid_rid ON building_maintenance(building_id, resource_id)'),
+    ('resources', 'CREATE INDEX IF NOT EXISTS idx_resources_map ON resources(map_id)'),
+)
+
+# Shared read connection for the analysis scripts. A big page cache plus mmap-backed
+# I/O means repeated pd.read_sql calls in one run mostly hit memory, and the
+# covering indexes turn the relationship joins into index lookups.
+@lru_cache(maxsize=1)
+def get_db_connection():
+    conn = sqlite3.connect(DB_FILE)
+    conn.execute('PRAGMA journal_mode=WAL')
+    conn.execute('PRAGMA synchronous=NORMAL')
+    conn.execute('PRAGMA cache_size=-65536')
+    conn.execute('PRAGMA temp_store=MEMORY')
+    conn.execute('PRAGMA mmap_size=268435456')
+    existing = {name for (name,) in conn.execute(
+        "SELECT name FROM sqlite_master WHERE type='table'")}
+    for table, stmt in _INDEX_STATEMENTS:
+        if table in existing:
+            conn.execute(stmt)
+    conn.commit()
+    return conn
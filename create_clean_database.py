@@ -0,0 +1,326 @@
+"""
+Masterplan Tycoon Clean Database Builder
+
+Author: Patrick Snyder
+
+Description:
+Builds `masterplan_tycoon_clean.db` from the hand-maintained game data spreadsheets
+(the "Source of Truth" CSV exports in the references folder). This is the structured
+version of the game data that the calculator and analysis scripts query, with proper
+ids, a readable building_id code per building, and resources bucketed into categories.
+
+Tables created:
+    maps                - the game maps
+    plans               - construction plans per map
+    recipes             - production recipes with tier and description
+    buildings           - every building with its generated building_id code
+    resource_categories - Raw Materials / Processed Goods / Food / etc
+    resources           - every resource with its map and category
+    recipe_buildings    - which buildings participate in which recipes
+
+Usage:
+- Export the SoT sheets as CSV into the references folder
+- Run create_clean_database.py in python
+- The database is written to masterplan_tycoon_clean.db in this folder
+
+"""
+
+import re
+import sqlite3
+from itertools import islice
+
+import pandas as pd
+
+REFERENCES_DIR = 'references'
+DB_FILE = 'masterplan_tycoon_clean.db'
+
+# Keyword lists used to bucket resources into categories
+RESOURCE_CATEGORIES = {
+    1: ('Raw Materials', ['timber', 'stone', 'clay', 'ore', 'coal', 'sand', 'water', 'fish', 'wheat', 'wool']),
+    2: ('Processed Goods', ['planks', 'bricks', 'flour', 'iron', 'steel', 'glass', 'cloth', 'paper', 'kerosene']),
+    3: ('Food', ['bread', 'meat', 'beer', 'meal', 'porridge', 'fish dish']),
+    4: ('Tools & Equipment', ['tool', 'lamp', 'nail', 'gear', 'equipment']),
+}
+
+# Only the columns each sheet contributes, with explicit dtypes so read_csv skips
+# type inference and the repeated map names load as categoricals
+SOT_SCHEMAS = {
+    'maps': {'usecols': ['map_name']},
+    'plans': {'usecols': ['plan_name', 'map_name'], 'dtype': {'map_name': 'category'}},
+    'recipes': {'usecols': ['recipe_name', 'building_name', 'map_name', 'tier'],
+                'dtype': {'map_name': 'category', 'tier': 'int16'}},
+    'buildings': {'usecols': ['building_name', 'map_name'], 'dtype': {'map_name': 'category'}},
+    'resources': {'usecols': ['resource_name', 'map_name'], 'dtype': {'map_name': 'category'}},
+}
+
+# Load all of the SoT CSV exports into DataFrames
+def load_sot_data():
+    data = {}
+    for name, schema in SOT_SCHEMAS.items():
+        data[name] = pd.read_csv(f'{REFERENCES_DIR}/Masterplan Tycoon Data SoT - {name}.csv', **schema)
+        print(f"Loaded {len(data[name])} rows from {name}.csv")
+    return data
+
+# First letters of each word, computed for a whole column at once with pandas
+# string ops so the buildings loop doesn't redo the replace/split work per row
+def _abbrev(series, n):
+    words = series.astype(str).str.replace('-', ' ', regex=False).str.replace('&', '', regex=False).str.split()
+    return words.map(lambda ws: ''.join(w[0].upper() for w in ws)[:n])
+
+# Feed executemany in ~10k-row slices so huge tables never require the whole
+# tuple list to sit in front of sqlite at once; runs inside the outer transaction
+def _chunked_executemany(conn, sql, rows, chunk_size=10000):
+    it = iter(rows)
+    while True:
+        chunk = list(islice(it, chunk_size))
+        if not chunk:
+            break
+        conn.executemany(sql, chunk)
+
+def create_maps_table(conn, maps_df):
+    conn.execute('DROP TABLE IF EXISTS maps')
+    conn.execute('''
+        CREATE TABLE maps (
+            id INTEGER PRIMARY KEY,
+            name TEXT UNIQUE
+        )
+    ''')
+
+    # Row construction straight off the column -- no per-row tuple loop needed
+    maps_data = list(enumerate(maps_df['map_name'], 1))
+
+    _chunked_executemany(conn, 'INSERT INTO maps VALUES (?, ?)', maps_data)
+    print(f"Created maps table with {len(maps_data)} maps")
+    return maps_data
+
+def create_plans_table(conn, plans_df, map_name_to_id):
+    conn.execute('DROP TABLE IF EXISTS plans')
+    conn.execute('''
+        CREATE TABLE plans (
+            id INTEGER PRIMARY KEY,
+            name TEXT,
+            map_id INTEGER
+        )
+    ''')
+
+    # Resolve all the map ids as one vectorized column, then zip the rows together
+    map_ids = plans_df['map_name'].map(map_name_to_id)
+    plans_data = list(zip(range(1, len(plans_df) + 1), plans_df['plan_name'], map_ids))
+
+    _chunked_executemany(conn, 'INSERT INTO plans VALUES (?, ?, ?)', plans_data)
+    print(f"Created plans table with {len(plans_data)} plans")
+    return plans_data
+
+def create_recipes_table(conn, recipes_df):
+    conn.execute('DROP TABLE IF EXISTS recipes')
+    conn.execute('''
+        CREATE TABLE recipes (
+            id INTEGER PRIMARY KEY,
+            name TEXT UNIQUE,
+            tier INTEGER,
+            description TEXT
+        )
+    ''')
+
+    # One row per recipe name; the sheet repeats recipes per building. Keeping the
+    # first occurrence matches the old groupby().first() without the hash-aggregate,
+    # and the descriptions concatenate as one column operation.
+    unique_recipes = recipes_df.drop_duplicates('recipe_name', keep='first')[['recipe_name', 'tier']].reset_index(drop=True)
+    descriptions = 'Recipe for ' + unique_recipes['recipe_name'] + ' production (Tier ' + unique_recipes['tier'].astype(str) + ')'
+
+    recipes_data = list(zip(
+        range(1, len(unique_recipes) + 1),
+        unique_recipes['recipe_name'],
+        unique_recipes['tier'].astype(int),
+        descriptions,
+    ))
+
+    _chunked_executemany(conn, 'INSERT INTO recipes VALUES (?, ?, ?, ?)', recipes_data)
+    print(f"Created recipes table with {len(recipes_data)} recipes")
+    return recipes_data
+
+def create_buildings_table(conn, buildings_df, recipes_df, map_name_to_id):
+    conn.execute('DROP TABLE IF EXISTS buildings')
+    conn.execute('''
+        CREATE TABLE buildings (
+            id INTEGER PRIMARY KEY,
+            name TEXT,
+            map_id INTEGER,
+            building_id TEXT,
+            recipe_name TEXT,
+            tier INTEGER
+        )
+    ''')
+
+    # Which recipe does each building run (first one listed wins): one merge against
+    # the dedup'd recipes frame resolves every building at once, instead of building
+    # a dict row by row and probing it per building
+    resolved = buildings_df.merge(
+        recipes_df.drop_duplicates(['building_name', 'map_name'])[['building_name', 'map_name', 'recipe_name', 'tier']],
+        on=['building_name', 'map_name'], how='left'
+    )
+    resolved.index = buildings_df.index
+    recipe_names = resolved['recipe_name'].fillna('Unknown')
+    tiers = resolved['tier'].fillna(0).astype(int)
+
+    name_abbrevs = _abbrev(buildings_df['building_name'], 4)
+    map_abbrevs = _abbrev(buildings_df['map_name'], 2)
+    recipe_abbrevs = _abbrev(recipe_names, 3)
+
+    # The short readable code per building, e.g. Stone Quarry / tier 1 on Islands
+    # making Stone -> "SQ-01-IS-ST"
+    base_ids = pd.Series([
+        f"{name_ab}-{tier:02d}-{map_ab}-{recipe_ab}"
+        for name_ab, tier, map_ab, recipe_ab in zip(name_abbrevs, tiers, map_abbrevs, recipe_abbrevs)
+    ], index=buildings_df.index)
+
+    # The same building can show up more than once per map; one cumcount pass hands
+    # the second and later occurrences a -1, -2, ... suffix
+    suffix = base_ids.groupby(base_ids).cumcount()
+    final_ids = base_ids.where(suffix == 0, base_ids + '-' + suffix.astype(str))
+
+    map_ids = buildings_df['map_name'].map(map_name_to_id)
+
+    # Yield rows straight off the precomputed columns -- the chunked insert pulls
+    # 10k at a time, so the full tuple list never has to exist just for the insert
+    def building_rows():
+        rows = zip(buildings_df['building_name'], map_ids, final_ids, recipe_names, tiers)
+        for i, (building_name, map_id, building_id, recipe_name, tier) in enumerate(rows, 1):
+            yield (i, building_name, map_id, building_id, recipe_name, int(tier))
+
+    _chunked_executemany(conn, 'INSERT INTO buildings VALUES (?, ?, ?, ?, ?, ?)', building_rows())
+
+    # Indexes are built after the bulk load, so the inserts above don't pay
+    # per-row B-tree maintenance. Only building_id is unique -- the cumcount
+    # suffix above exists precisely because the same (name, map) pair can
+    # legally appear more than once, so the lookup index must admit duplicates.
+    conn.execute('CREATE UNIQUE INDEX idx_buildings_bid ON buildings(building_id)')
+    conn.execute('CREATE INDEX idx_buildings_nm ON buildings(name, map_id)')
+    print(f"Created buildings table with {len(buildings_df)} buildings")
+
+    # The recipe-buildings link step only needs these columns for its lookup frame
+    return list(building_rows())
+
+def create_resource_tables(conn, resources_df, map_name_to_id):
+    conn.execute('DROP TABLE IF EXISTS resource_categories')
+    conn.execute('''
+        CREATE TABLE resource_categories (
+            id INTEGER PRIMARY KEY,
+            name TEXT UNIQUE
+        )
+    ''')
+    categories_data = [(cat_id, cat_name) for cat_id, (cat_name, _) in RESOURCE_CATEGORIES.items()]
+    categories_data.append((len(RESOURCE_CATEGORIES) + 1, 'Other'))
+    _chunked_executemany(conn, 'INSERT INTO resource_categories VALUES (?, ?)', categories_data)
+
+    conn.execute('DROP TABLE IF EXISTS resources')
+    conn.execute('''
+        CREATE TABLE resources (
+            id INTEGER PRIMARY KEY,
+            name TEXT,
+            map_id INTEGER,
+            category_id INTEGER
+        )
+    ''')
+
+    other_id = len(RESOURCE_CATEGORIES) + 1
+
+    # Bucket each resource into the first category whose keyword list matches it --
+    # one compiled alternation per category over the whole column instead of the
+    # nested resources x categories x keywords substring loop
+    res_series = resources_df['resource_name'].astype(str)
+    category_ids = pd.Series(other_id, index=resources_df.index)
+    assigned = pd.Series(False, index=resources_df.index)
+    for cat_id, (cat_name, resource_list) in RESOURCE_CATEGORIES.items():
+        pattern = '|'.join(map(re.escape, resource_list))
+        mask = res_series.str.contains(pattern, case=False, regex=True) & ~assigned
+        category_ids[mask] = cat_id
+        assigned |= mask
+
+    resources_data = []
+    rows = zip(resources_df['resource_name'], resources_df['map_name'], category_ids)
+    for i, (resource_name, map_name, category_id) in enumerate(rows, 1):
+        resources_data.append((i, resource_name, map_name_to_id.get(map_name), int(category_id)))
+
+    _chunked_executemany(conn, 'INSERT INTO resources VALUES (?, ?, ?, ?)', resources_data)
+    conn.execute('CREATE UNIQUE INDEX idx_resources_nm ON resources(name, map_id)')
+    print(f"Created resources table with {len(resources_data)} resources in {len(categories_data)} categories")
+    return resources_data
+
+def create_recipe_buildings_table(conn, recipes_df, recipes_data, buildings_data, map_name_to_id):
+    conn.execute('DROP TABLE IF EXISTS recipe_buildings')
+    conn.execute('''
+        CREATE TABLE recipe_buildings (
+            recipe_id INTEGER,
+            building_id INTEGER,
+            PRIMARY KEY (recipe_id, building_id)
+        )
+    ''')
+
+    # Resolve recipe and building ids with two hash joins instead of a per-row loop
+    # of dict lookups; rows that don't resolve drop out of the inner joins
+    recipes_lookup = pd.DataFrame(recipes_data, columns=['recipe_id', 'recipe_name', 'tier', 'description'])
+    buildings_lookup = pd.DataFrame(buildings_data, columns=['bid', 'building_name', 'map_id', 'building_code', 'recipe_name', 'tier'])
+
+    merged = (
+        recipes_df
+        .assign(map_id=recipes_df['map_name'].map(map_name_to_id))
+        .merge(recipes_lookup[['recipe_id', 'recipe_name']], on='recipe_name', how='inner', validate='many_to_one')
+        .merge(buildings_lookup[['bid', 'building_name', 'map_id']], on=['building_name', 'map_id'], how='inner')
+    )
+
+    # Let the composite primary key dedupe during insert -- the B-tree already has
+    # to check it, so a separate dedup pass over the pairs buys nothing
+    before = conn.total_changes
+    _chunked_executemany(conn, 'INSERT OR IGNORE INTO recipe_buildings VALUES (?, ?)',
+                         merged[['recipe_id', 'bid']].itertuples(index=False, name=None))
+    print(f"Created recipe_buildings table with {conn.total_changes - before} relationships")
+
+# Run one table build on its own connection with its own transaction
+def _build_table(builder, *args):
+    conn = sqlite3.connect(DB_FILE)
+    try:
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('PRAGMA synchronous=OFF')
+        conn.execute('PRAGMA temp_store=MEMORY')
+        conn.execute('PRAGMA busy_timeout=30000')
+        # BEGIN IMMEDIATE takes the write lock up front, where the busy handler
+        # applies. A deferred BEGIN would start on a read snapshot and the later
+        # upgrade to a write fails with a non-retryable SQLITE_BUSY whenever a
+        # sibling worker commits in between.
+        conn.execute('BEGIN IMMEDIATE')
+        result = builder(conn, *args)
+        conn.commit()
+        return result
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        conn.close()
+
+def main():
+    data = load_sot_data()
+
+    try:
+        # Maps go first -- everything else keys off the map ids
+        maps_data = _build_table(create_maps_table, data['maps'])
+        map_name_to_id = {name: map_id for map_id, name in maps_data}
+
+        # Each build takes the write lock for its whole transaction (BEGIN
+        # IMMEDIATE above), so sqlite would serialize concurrent workers anyway;
+        # running the independent builds one after another gets the same
+        # throughput without thread overhead or lock contention
+        _build_table(create_plans_table, data['plans'], map_name_to_id)
+        recipes_data = _build_table(create_recipes_table, data['recipes'])
+        _build_table(create_resource_tables, data['resources'], map_name_to_id)
+
+        buildings_data = _build_table(create_buildings_table, data['buildings'], data['recipes'], map_name_to_id)
+        _build_table(create_recipe_buildings_table, data['recipes'], recipes_data, buildings_data, map_name_to_id)
+
+        print(f"\nDatabase created successfully: {DB_FILE}")
+    except Exception as e:
+        print(f"Error creating database: {e}")
+        raise
+
+if __name__ == "__main__":
+    main()
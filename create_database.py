@@ -0,0 +1,148 @@
+"""
+Masterplan Tycoon Database Builder (first pass)
+
+Author: Patrick Snyder
+
+Description:
+First pass at loading the game data spreadsheets (the "Source of Truth" CSV exports
+in the references folder) into SQLite so they can be queried instead of scrolled.
+Builds `masterplan_tycoon.db` with the maps, plans, and buildings, flagging which
+buildings consume and produce resources based on the inputs/outputs sheets.
+
+create_clean_database.py is the newer, more structured version of this; this builder
+is kept around because some of the exploratory scripts still read its schema.
+
+Usage:
+- Export the SoT sheets as CSV into the references folder
+- Run create_database.py in python
+
+"""
+
+import csv
+import sqlite3
+from itertools import islice
+
+import pandas as pd
+
+REFERENCES_DIR = 'references'
+DB_FILE = 'masterplan_tycoon.db'
+
+# The maps and plans sheets are a handful of rows; stdlib csv reads them without
+# paying DataFrame construction for data this small
+def _read_small_csv(path):
+    with open(path, newline='') as f:
+        return list(csv.DictReader(f))
+
+# executemany in bounded slices; keeps peak memory flat on the bigger sheets
+def _chunked_executemany(conn, sql, rows, chunk_size=10000):
+    it = iter(rows)
+    while True:
+        chunk = list(islice(it, chunk_size))
+        if not chunk:
+            break
+        conn.executemany(sql, chunk)
+
+def create_maps_table(conn, maps_rows):
+    conn.execute('DROP TABLE IF EXISTS maps')
+    conn.execute('''
+        CREATE TABLE maps (
+            id INTEGER PRIMARY KEY,
+            name TEXT UNIQUE
+        )
+    ''')
+
+    maps_data = [(i, row['map_name']) for i, row in enumerate(maps_rows, 1)]
+
+    _chunked_executemany(conn, 'INSERT INTO maps VALUES (?, ?)', maps_data)
+    print(f"Created maps table with {len(maps_data)} maps")
+
+def create_plans_table(conn, plans_rows, map_name_to_id):
+    conn.execute('DROP TABLE IF EXISTS plans')
+    conn.execute('''
+        CREATE TABLE plans (
+            id INTEGER PRIMARY KEY,
+            name TEXT,
+            map_id INTEGER
+        )
+    ''')
+
+    plans_data = [(i, row['plan_name'], map_name_to_id.get(row['map_name'])) for i, row in enumerate(plans_rows, 1)]
+
+    _chunked_executemany(conn, 'INSERT INTO plans VALUES (?, ?, ?)', plans_data)
+    print(f"Created plans table with {len(plans_data)} plans")
+
+def create_buildings_table(conn, buildings_enriched, map_name_to_id):
+    conn.execute('DROP TABLE IF EXISTS buildings')
+    conn.execute('''
+        CREATE TABLE buildings (
+            id INTEGER PRIMARY KEY,
+            buid TEXT,
+            name TEXT,
+            map_id INTEGER,
+            has_inputs INTEGER,
+            has_outputs INTEGER
+        )
+    ''')
+
+    # The relationship counts arrive precomputed on the frame (see main), so the
+    # flags and map ids all come out as whole columns
+    buildings_data = list(zip(
+        range(1, len(buildings_enriched) + 1),
+        buildings_enriched['buid'],
+        buildings_enriched['building_name'],
+        buildings_enriched['map_name'].map(map_name_to_id),
+        (buildings_enriched['n_in'] > 0).astype(int),
+        (buildings_enriched['n_out'] > 0).astype(int),
+    ))
+
+    _chunked_executemany(conn, 'INSERT INTO buildings VALUES (?, ?, ?, ?, ?, ?)', buildings_data)
+    print(f"Created buildings table with {len(buildings_data)} buildings")
+
+def main():
+    # Only the columns this builder uses -- the inputs/outputs sheets are just
+    # checked for buid membership, so skip parsing everything else in them
+    maps_rows = _read_small_csv(f'{REFERENCES_DIR}/Masterplan Tycoon Data SoT - maps.csv')
+    plans_rows = _read_small_csv(f'{REFERENCES_DIR}/Masterplan Tycoon Data SoT - plans.csv')
+    buildings_df = pd.read_csv(f'{REFERENCES_DIR}/Masterplan Tycoon Data SoT - buildings.csv',
+                               usecols=['buid', 'building_name', 'map_name'], dtype={'map_name': 'category'})
+    inputs_df = pd.read_csv(f'{REFERENCES_DIR}/Masterplan Tycoon Data SoT - inputs.csv', usecols=['buid'])
+    outputs_df = pd.read_csv(f'{REFERENCES_DIR}/Masterplan Tycoon Data SoT - outputs.csv', usecols=['buid'])
+
+    # Count relationship rows per building with two merges up front; the buildings
+    # build then reads plain columns instead of probing the sheets per row
+    buildings_enriched = (
+        buildings_df
+        .merge(inputs_df.groupby('buid').size().rename('n_in'), left_on='buid', right_index=True, how='left')
+        .merge(outputs_df.groupby('buid').size().rename('n_out'), left_on='buid', right_index=True, how='left')
+        .fillna({'n_in': 0, 'n_out': 0})
+    )
+
+    conn = sqlite3.connect(DB_FILE)
+
+    # Bulk-load tuning: one fsync for the whole build instead of one per table
+    conn.execute('PRAGMA journal_mode=WAL')
+    conn.execute('PRAGMA synchronous=OFF')
+    conn.execute('PRAGMA temp_store=MEMORY')
+
+    try:
+        conn.execute('BEGIN')
+
+        create_maps_table(conn, maps_rows)
+
+        # Resolve map names to ids once for both dependent table builds
+        map_name_to_id = {row['map_name']: i for i, row in enumerate(maps_rows, 1)}
+
+        create_plans_table(conn, plans_rows, map_name_to_id)
+        create_buildings_table(conn, buildings_enriched, map_name_to_id)
+
+        conn.commit()
+        print(f"\nDatabase created successfully: {DB_FILE}")
+    except Exception as e:
+        conn.rollback()
+        print(f"Error creating database: {e}")
+        raise
+    finally:
+        conn.close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,242 @@
+"""
+Masterplan Tycoon Relationship Table Builder
+
+Author: Patrick Snyder
+
+Description:
+Fills in the part of the clean database the validator and port analyzer lean on:
+which resources each building consumes and produces, and what it costs to build
+and maintain. The quantities come from the SoT relationship sheets (inputs,
+outputs, construction, maintenance), with building and resource names resolved
+against the ids already in masterplan_tycoon_clean.db.
+
+Tables created:
+    building_inputs       - resources a building consumes per cycle
+    building_outputs      - resources a building produces, with timing
+    building_construction - one-time build costs
+    building_maintenance  - recurring upkeep costs
+
+Usage:
+- Build the base database first (create_clean_database.py)
+- Export the relationship SoT sheets as CSV into the references folder
+- Run create_relationship_tables.py in python
+
+"""
+
+import os
+import sqlite3
+
+import pandas as pd
+
+REFERENCES_DIR = 'references'
+DB_FILE = 'masterplan_tycoon_clean.db'
+
+# Parse a sheet's CSV once and cache it as Parquet alongside; if no Parquet
+# engine is installed the CSV parse still happens, just uncached
+def _materialize_parquet(csv_path, parquet_path):
+    df = pd.read_csv(csv_path)
+    try:
+        df.to_parquet(parquet_path)
+    except ImportError:
+        pass
+    return df
+
+# Load the four relationship sheets, preferring the Parquet cache: the columnar
+# read lands straight in typed arrays instead of re-tokenizing CSV text per run
+def load_relationship_data():
+    sheets = {}
+    for name in ('inputs', 'outputs', 'construction', 'maintenance'):
+        csv_path = f'{REFERENCES_DIR}/Masterplan Tycoon Data SoT - {name}.csv'
+        parquet_path = csv_path[:-4] + '.parquet'
+        # A re-exported CSV must win over a stale cache: only reuse the Parquet
+        # while it is at least as new as its CSV
+        use_cache = os.path.exists(parquet_path) and (
+            not os.path.exists(csv_path)
+            or os.path.getmtime(parquet_path) >= os.path.getmtime(csv_path))
+        if use_cache:
+            sheets[name] = pd.read_parquet(parquet_path)
+        else:
+            sheets[name] = _materialize_parquet(csv_path, parquet_path)
+        print(f"Loaded {len(sheets[name])} rows from {name}")
+    return sheets
+
+# Pull the (name, map) -> id mapping frames the creators join against
+def get_database_lookups(conn):
+    buildings_df = pd.read_sql('''
+        SELECT b.id AS building_id, b.name AS building_name, m.name AS map_name
+        FROM buildings b JOIN maps m ON m.id = b.map_id
+    ''', conn)
+    resources_df = pd.read_sql('''
+        SELECT r.id AS resource_id, r.name AS resource_name, m.name AS map_name
+        FROM resources r JOIN maps m ON m.id = r.map_id
+    ''', conn)
+
+    # The map column repeats a handful of names thousands of times; factorize it
+    # to small int codes once so every downstream merge hashes (name, int)
+    # instead of re-hashing the map string per row
+    map_code = {name: code for code, name in enumerate(pd.unique(
+        pd.concat([buildings_df['map_name'], resources_df['map_name']], ignore_index=True)))}
+    buildings_df['map_code'] = buildings_df['map_name'].map(map_code)
+    resources_df['map_code'] = resources_df['map_name'].map(map_code)
+    buildings_df = buildings_df.drop(columns='map_name')
+    resources_df = resources_df.drop(columns='map_name')
+
+    print(f"Lookups ready: {len(buildings_df)} buildings, {len(resources_df)} resources, "
+          f"{len(map_code)} maps")
+    return buildings_df, resources_df, map_code
+
+# Resolve every sheet row's building and resource ids with two hash joins in C,
+# instead of two dict probes per row in Python. Returns the resolved frame plus
+# the (name, map) pairs the database didn't know.
+def _resolve_ids(df, buildings_df, resources_df, map_code, resource_col):
+    # One vectorized .map converts the sheet's map column to the shared codes;
+    # names the database has never seen get NaN and fall out as merge misses
+    df = df.assign(map_code=df['map_name'].map(map_code))
+    merged = (df
+              .merge(buildings_df, on=['building_name', 'map_code'], how='left')
+              .merge(resources_df.rename(columns={'resource_name': resource_col}),
+                     on=[resource_col, 'map_code'], how='left'))
+
+    missing_b = merged['building_id'].isna()
+    missing_r = merged['resource_id'].isna() & ~missing_b
+    # Only a total and a few examples survive into the warning printout, so
+    # slice the first ten distinct misses instead of materializing every one
+    # as a Python tuple in a set
+    missing_buildings = (int(missing_b.sum()), [
+        tuple(row) for row in merged.loc[missing_b, ['building_name', 'map_name']]
+        .drop_duplicates().head(10).to_numpy()])
+    missing_resources = (int(missing_r.sum()), [
+        tuple(row) for row in merged.loc[missing_r, [resource_col, 'map_name']]
+        .drop_duplicates().head(10).to_numpy()])
+
+    resolved = merged.dropna(subset=['building_id', 'resource_id'])
+    return resolved, missing_buildings, missing_resources
+
+# Everything that differs between the four relationship tables lives here; the
+# builder below is the single shared load path. Extras are (sheet column,
+# table column, SQL type) triples for the timing fields only outputs carries.
+TABLE_SPECS = {
+    'inputs': {
+        'table': 'building_inputs',
+        'resource_col': 'input_resource',
+        'qty_col': 'input_resource_qty',
+        'index': 'idx_bi_pk',
+        'extras': (),
+    },
+    'outputs': {
+        'table': 'building_outputs',
+        'resource_col': 'output_resource',
+        'qty_col': 'output_resource_qty',
+        'index': 'idx_bo_pk',
+        'extras': (('output_time(s)', 'production_time_seconds', 'INTEGER'),
+                   ('output_per_minute', 'output_per_minute', 'REAL')),
+    },
+    'construction': {
+        'table': 'building_construction',
+        'resource_col': 'construction_resource',
+        'qty_col': 'construction_resource_qty',
+        'index': 'idx_bc_pk',
+        'extras': (),
+    },
+    'maintenance': {
+        'table': 'building_maintenance',
+        'resource_col': 'maintenance_resource',
+        'qty_col': 'maintenance_resource_qty',
+        'index': 'idx_bm_pk',
+        'extras': (),
+    },
+}
+
+# Drop, recreate, resolve, dedup, and bulk-load one relationship table per spec
+def _create_relationship_table(conn, df, spec, buildings_df, resources_df, map_code):
+    table = spec['table']
+    conn.execute(f'DROP TABLE IF EXISTS {table}')
+    extra_ddl = ''.join(f',\n            {col} {sqltype}' for _, col, sqltype in spec['extras'])
+    conn.execute(f'''
+        CREATE TABLE {table} (
+            building_id INTEGER,
+            resource_id INTEGER,
+            quantity REAL{extra_ddl}
+        )
+    ''')
+
+    renames = {spec['qty_col']: 'quantity'}
+    renames.update({sheet_col: table_col for sheet_col, table_col, _ in spec['extras']})
+    resolved, missing_buildings, missing_resources = _resolve_ids(
+        df.rename(columns=renames), buildings_df, resources_df, map_code, spec['resource_col'])
+
+    columns = ['building_id', 'resource_id', 'quantity'] + [t for _, t, _ in spec['extras']]
+    frame = (resolved[columns]
+             .drop_duplicates(subset=['building_id', 'resource_id'], keep='first')
+             .astype({'building_id': 'int64', 'resource_id': 'int64'}))
+    frame.to_sql(table, conn, if_exists='append', index=False,
+                 method='multi', chunksize=500)
+    # Build the uniqueness index after the bulk load: one sort-and-build pass
+    # instead of a B-tree update per inserted row
+    conn.execute(f'CREATE UNIQUE INDEX {spec["index"]} ON {table}(building_id, resource_id)')
+    print(f"Created {table} with {len(frame)} rows")
+    _report_missing(missing_buildings, missing_resources)
+
+# Shared warning printout for names the database doesn't know; each argument
+# is a (total row count, first few distinct examples) pair
+def _report_missing(missing_buildings, missing_resources):
+    building_count, building_examples = missing_buildings
+    resource_count, resource_examples = missing_resources
+    if building_count:
+        print(f"  WARNING: {building_count} rows with unknown buildings, e.g. {building_examples[:5]}")
+    if resource_count:
+        print(f"  WARNING: {resource_count} rows with unknown resources, e.g. {resource_examples[:5]}")
+
+# Eyeball a few rows of each new table to confirm the load looks sane
+def debug_relationships(conn):
+    print("\n=== RELATIONSHIP SAMPLES ===")
+
+    # Raw cursor fetches for the tiny count and LIMIT 5 probes: pd.read_sql
+    # pays schema introspection and dtype inference per call, which dwarfs the
+    # queries themselves at this size
+    cur = conn.cursor()
+    for spec in TABLE_SPECS.values():
+        table = spec['table']
+        count = cur.execute(f'SELECT COUNT(*) FROM {table}').fetchone()[0]
+        print(f"\n{table}: {count} rows")
+        for row in cur.execute(f'SELECT * FROM {table} LIMIT 5').fetchall():
+            print(f"  {row}")
+
+    # The joined sanity check keeps read_sql; the DataFrame formatting is the
+    # point there
+    type_check = pd.read_sql('''
+        SELECT b.name, r.name AS resource, bo.quantity, bo.output_per_minute
+        FROM building_outputs bo
+        JOIN buildings b ON b.id = bo.building_id
+        JOIN resources r ON r.id = bo.resource_id
+        LIMIT 5
+    ''', conn)
+    print("\nJoined sample:")
+    print(type_check.to_string(index=False))
+
+def main():
+    # One connection for the whole run: the lookups warm the same page cache
+    # the loads use, and the PRAGMAs below apply to everything
+    conn = sqlite3.connect(DB_FILE)
+    try:
+        # WAL plus one explicit transaction around all four loads: the journal
+        # fsyncs once at commit instead of once per statement
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('PRAGMA synchronous=NORMAL')
+        # Keep the post-load index sorts in memory rather than spilling to disk
+        conn.execute('PRAGMA temp_store=MEMORY')
+        conn.execute('PRAGMA cache_size=-64000')
+
+        buildings_df, resources_df, map_code = get_database_lookups(conn)
+        sheets = load_relationship_data()
+
+        with conn:
+            for sheet_name, spec in TABLE_SPECS.items():
+                _create_relationship_table(conn, sheets[sheet_name], spec,
+                                           buildings_df, resources_df, map_code)
+        debug_relationships(conn)
+    finally:
+        conn.close()
+
+if __name__ == "__main__":
+    main()
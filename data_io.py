@@ -0,0 +1,98 @@
+"""
+Masterplan Tycoon Save File Loader
+
+Author: Patrick Snyder
+
+Description:
+Shared save-file loading for the dashboard (masterplan_analysis.py) and the console
+analyzers. Every script used to find and parse the save file on its own, which meant
+running several analyzers back to back re-parsed the same multi-MB JSON each time.
+The loader here is cached, so the first caller pays for the parse and everyone after
+that gets the already-loaded data.
+
+The save file lives in the game's save directory
+(`C:\\Users\\<username>\\AppData\\LocalLow\\Bureau Bravin\\Masterplan Tycoon`).
+
+"""
+
+import os
+import getpass
+import json
+from functools import lru_cache
+
+# ijson lets us stream the save file instead of loading it all at once, but everything
+# still works without it
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Find the save file in the current user's directory
+def find_save_file():
+
+    # Try to automatically set the username and save file path
+    # DON'T UPDATE THESE
+    username = getpass.getuser()  # Get current Windows username
+    save_dir = os.path.join('C:', 'Users', username, 'AppData', 'LocalLow', 'Bureau Bravin', 'Masterplan Tycoon')
+    save_file = os.path.join(save_dir, 'save_0.sav')
+
+    # CUSTOM username AND filepath
+    # If the script isn't running, you can hard code in your username, file path, and filename below
+    # Override username by uncommenting next line
+    #username = "myusername"
+
+    # Override directory by uncommenting next line (be sure to use the "\\" escape character)
+    #save_dir = os.path("C:\\This\\is\\the\\custom\\file\\path")
+
+    # Override the target save file by uncommenting the next line (Slot 1 = save_0, Slot 2 = save_1, etc)
+    #save_file = os.path.join(save_dir, 'save_1.sav')
+
+    # END User Configuration
+
+    if os.path.exists(save_file):
+        return save_file
+    else:
+        print(f"Save file not found at {save_file}")
+        return None
+
+# Keep only the node fields the analyzers actually read
+def _trim_node(node):
+    construction = node.get('Construction') or {}
+    return {
+        'ConfigID': node.get('ConfigID', ''),
+        'Construction': {
+            'IncomeStorage': construction.get('IncomeStorage', {}),
+            'OutcomeStorage': construction.get('OutcomeStorage', {}),
+            'ProductionUptime': construction.get('ProductionUptime', 0),
+        },
+    }
+
+# Load the JSON data from the save file. Cached so that running several analyzers in
+# one session only parses the save once.
+@lru_cache(maxsize=1)
+def load_save_file():
+    save_file = find_save_file()
+
+    if not save_file:
+        return None
+
+    if ijson is None:
+        with open(save_file, 'r') as file:
+            return json.load(file)
+
+    # Stream the node list instead of materializing the whole save tree as Python
+    # objects, keeping just the fields the analyzers use. The player stats and global
+    # storage sections are small, so grab those with their own targeted passes --
+    # ijson skips everything outside the requested prefix without building it.
+    with open(save_file, 'rb') as file:
+        nodes = [_trim_node(node) for node in ijson.items(file, 'Nodes.item')]
+    with open(save_file, 'rb') as file:
+        player_stats = next(ijson.items(file, 'PlayerStatistic'), {})
+    with open(save_file, 'rb') as file:
+        global_storage = next(ijson.items(file, 'GlobalStuffStorage'), {})
+
+    return {
+        'Nodes': nodes,
+        'PlayerStatistic': player_stats,
+        'GlobalStuffStorage': global_storage,
+    }
@@ -0,0 +1,334 @@
+"""
+Masterplan Tycoon Data Validator
+
+Author: Patrick Snyder
+
+Description:
+Sanity-checks the clean database (masterplan_tycoon_clean.db) before the calculator
+trusts it. The SoT spreadsheets are hand-maintained, so this script hunts for the
+kinds of data problems that would quietly break a production calculation: buildings
+that aren't wired into the resource flow, missing construction or maintenance costs,
+resources nothing produces, production loops, and extreme input/output ratios.
+
+Checks run:
+    - building connections: every building should have inputs and outputs
+    - construction & maintenance: every building should cost something to build/run
+    - resource chains: the production graph, cycles, and orphaned resources
+    - calculation breakers: ratios and quantities that would blow up the math
+    - map connectivity: per-map totals and cross-map resource dependencies
+
+Everything found is printed to the console and written to data_validation_report.json.
+
+Usage:
+- Build the database first (create_clean_database.py plus the relationship tables)
+- Run data_validator.py in python
+- Read the report sections, then check data_validation_report.json for the full lists
+
+"""
+
+import json
+import re
+import sqlite3
+from collections import defaultdict
+from datetime import datetime, timezone
+from itertools import islice
+
+import networkx as nx
+import pandas as pd
+
+# orjson serializes the report several times faster than stdlib json and knows
+# numpy scalars natively; stdlib stays as the fallback
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+DB_FILE = 'masterplan_tycoon_clean.db'
+
+# Transport-building detection, compiled once at import: one alternation handles all
+# the keywords in a single scan per name instead of a substring pass per keyword
+PORT_PATTERN = re.compile(r'port|dock|pier|harbor|ferry', re.IGNORECASE)
+
+class DataValidator:
+    def __init__(self):
+        self.conn = sqlite3.connect(DB_FILE)
+        self.issues = defaultdict(list)
+        self.warnings = defaultdict(list)
+        self._issue_count = 0
+        self._warning_count = 0
+        self.load_data()
+
+    # Record issues/warnings through these so the report summary is a pair of
+    # counter reads instead of another pass over every category
+    def _add_issues(self, category, items):
+        items = list(items)
+        self.issues[category].extend(items)
+        self._issue_count += len(items)
+
+    def _add_warnings(self, category, items):
+        items = list(items)
+        self.warnings[category].extend(items)
+        self._warning_count += len(items)
+
+    # Pull the core tables into DataFrames once so every check works off them
+    def load_data(self):
+        # Index the foreign keys the checks join on; without these every multi-way
+        # join below degrades to full-table scans. IF NOT EXISTS makes reruns free.
+        for stmt in (
+            'CREATE INDEX IF NOT EXISTS idx_bi_bid ON building_inputs(building_id)',
+            'CREATE INDEX IF NOT EXISTS idx_bi_rid ON building_inputs(resource_id)',
+            'CREATE INDEX IF NOT EXISTS idx_bo_bid ON building_outputs(building_id)',
+            'CREATE INDEX IF NOT EXISTS idx_bo_rid ON building_outputs(resource_id)',
+            'CREATE INDEX IF NOT EXISTS idx_bc_bid ON building_construction(building_id)',
+            'CREATE INDEX IF NOT EXISTS idx_bm_bid ON building_maintenance(building_id)',
+            'CREATE INDEX IF NOT EXISTS idx_b_mid ON buildings(map_id)',
+            'CREATE INDEX IF NOT EXISTS idx_r_mid ON resources(map_id)',
+        ):
+            self.conn.execute(stmt)
+        self.conn.commit()
+
+        self.buildings = pd.read_sql('''
+            SELECT b.id, b.name, b.building_id, b.tier, m.name AS map_name
+            FROM buildings b LEFT JOIN maps m ON m.id = b.map_id
+        ''', self.conn)
+        self.resources = pd.read_sql('''
+            SELECT r.id, r.name, m.name AS map_name
+            FROM resources r LEFT JOIN maps m ON m.id = r.map_id
+        ''', self.conn)
+        # The port check needs to know which buildings appear in the input/output
+        # relations; distinct ids are all it asks, so skip loading the full tables
+        self.input_building_ids = set(
+            pd.read_sql('SELECT DISTINCT building_id FROM building_inputs', self.conn)['building_id'])
+        self.output_building_ids = set(
+            pd.read_sql('SELECT DISTINCT building_id FROM building_outputs', self.conn)['building_id'])
+
+        print(f"Loaded {len(self.buildings)} buildings and {len(self.resources)} resources")
+
+    # "Buildings missing from relation X" as one anti-join, answered with names
+    # directly instead of materializing the relation and differencing id sets
+    def _buildings_missing_from(self, relation):
+        return pd.read_sql(f'''
+            SELECT b.name FROM buildings b
+            LEFT JOIN {relation} x ON x.building_id = b.id
+            WHERE x.building_id IS NULL
+        ''', self.conn)['name'].tolist()
+
+    # Every building should be wired into the resource flow on both sides
+    def validate_building_connections(self):
+        print("\n=== BUILDING CONNECTIONS ===")
+
+        no_input_buildings = self._buildings_missing_from('building_inputs')
+        no_output_buildings = self._buildings_missing_from('building_outputs')
+
+        print(f"Buildings with no inputs: {len(no_input_buildings)}")
+        print(f"Buildings with no outputs: {len(no_output_buildings)}")
+
+        self._add_issues('buildings_no_inputs', no_input_buildings)
+        self._add_issues('buildings_no_outputs', no_output_buildings)
+
+        # Ports move resources between maps rather than producing them, so missing
+        # recipe inputs/outputs is expected there -- note them separately. One
+        # vectorized substring pass over the name column finds them all at once.
+        mask = self.buildings['name'].str.contains(PORT_PATTERN, na=False)
+        ports = (
+            self.buildings[mask]
+            .assign(has_inputs=lambda d: d['id'].isin(self.input_building_ids),
+                    has_outputs=lambda d: d['id'].isin(self.output_building_ids))
+            [['name', 'map_name', 'has_inputs', 'has_outputs']]
+            .to_dict('records')
+        )
+
+        print(f"Transport buildings found: {len(ports)}")
+        self._add_warnings('transport_buildings', (p['name'] for p in ports))
+
+    # Every building should cost something to build and something to run
+    def validate_construction_maintenance(self):
+        print("\n=== CONSTRUCTION & MAINTENANCE ===")
+
+        no_construction_names = self._buildings_missing_from('building_construction')
+        no_maintenance_names = self._buildings_missing_from('building_maintenance')
+
+        print(f"Buildings with no construction cost: {len(no_construction_names)}")
+        print(f"Buildings with no maintenance cost: {len(no_maintenance_names)}")
+
+        self._add_issues('buildings_no_construction', no_construction_names)
+        self._add_warnings('buildings_no_maintenance', no_maintenance_names)
+
+    # Build the resource production graph and look for structural problems
+    def validate_resource_chains(self):
+        print("\n=== RESOURCE CHAINS ===")
+
+        production_data = pd.read_sql('''
+            SELECT b.name AS building_name,
+                   r_in.name AS input_resource, r_out.name AS output_resource,
+                   bi.quantity AS input_qty, bo.quantity AS output_qty
+            FROM buildings b
+            JOIN building_inputs bi ON bi.building_id = b.id
+            JOIN building_outputs bo ON bo.building_id = b.id
+            JOIN resources r_in ON r_in.id = bi.resource_id
+            JOIN resources r_out ON r_out.id = bo.resource_id
+        ''', self.conn)
+
+        # Bulk-load the edges straight off the frame; one vectorized construction
+        # instead of a Series allocation and an add_edge dict update per row
+        G = nx.from_pandas_edgelist(
+            production_data.rename(columns={'building_name': 'building'}),
+            source='input_resource', target='output_resource',
+            edge_attr=['building', 'input_qty', 'output_qty'],
+            create_using=nx.DiGraph)
+
+        print(f"Production graph: {G.number_of_nodes()} resources, {G.number_of_edges()} conversions")
+
+        # Grab every node's degree once up front; the checks below become dict
+        # lookups instead of materializing predecessor/successor lists per node
+        in_deg = dict(G.in_degree())
+        out_deg = dict(G.out_degree())
+
+        # Resources no recipe touches at all
+        isolated = [r for r in self.resources['name']
+                    if in_deg.get(r, 0) == 0 and out_deg.get(r, 0) == 0]
+
+        # Resources that get consumed but are never an output (raw materials should
+        # be the only ones here)
+        no_producers = [n for n, d in in_deg.items() if d == 0 and out_deg.get(n, 0) > 0]
+
+        print(f"Isolated resources: {len(isolated)}")
+        print(f"Consumed but never produced (raw materials): {len(no_producers)}")
+
+        self._add_warnings('isolated_resources', isolated)
+        self._add_warnings('raw_materials', no_producers)
+
+        # Production loops would make a naive calculator recurse forever. Enumerating
+        # every elementary cycle in the full digraph is exponential in the worst case;
+        # find the strongly connected components first (linear) and only enumerate a
+        # few cycles inside each non-trivial one -- enough to report, bounded cost.
+        cycles = []
+        for component in nx.strongly_connected_components(G):
+            if len(component) > 1:
+                cycles.extend(islice(nx.simple_cycles(G.subgraph(component)), 5))
+                if len(cycles) >= 50:
+                    break
+        if cycles:
+            print(f"Found {len(cycles)} production cycles (first 3):")
+            for cycle in cycles[:3]:
+                print("  " + " -> ".join(cycle))
+            self._add_issues('production_cycles', (" -> ".join(c) for c in cycles))
+        else:
+            print("No production cycles found.")
+
+    # Find the numbers that would blow up the production math
+    def detect_calculation_breakers(self):
+        print("\n=== CALCULATION BREAKERS ===")
+
+        zero_quantities = pd.read_sql('''
+            SELECT b.name AS building, r.name AS resource, bi.quantity
+            FROM building_inputs bi
+            JOIN buildings b ON b.id = bi.building_id
+            JOIN resources r ON r.id = bi.resource_id
+            WHERE bi.quantity <= 0
+        ''', self.conn)
+
+        print(f"Zero/negative input quantities: {len(zero_quantities)}")
+        self._add_issues('zero_quantities', (
+            f"{row.building}: {row.resource}"
+            for row in zero_quantities.itertuples(index=False)))
+
+        # Conversions that eat more than 10x what they put out deserve a second look.
+        # The CTE computes each ratio once (NULLIF guards the zero-output rows that
+        # previously fell out as silent NULLs) and the filter reads the named column.
+        extreme_ratios = pd.read_sql('''
+            WITH io AS (
+                SELECT b.name AS building,
+                       r_in.name AS input_resource, r_out.name AS output_resource,
+                       bi.quantity AS input_qty, bo.quantity AS output_qty,
+                       CAST(bi.quantity AS REAL) / NULLIF(bo.quantity, 0) AS ratio
+                FROM buildings b
+                JOIN building_inputs bi ON bi.building_id = b.id
+                JOIN building_outputs bo ON bo.building_id = b.id
+                JOIN resources r_in ON r_in.id = bi.resource_id
+                JOIN resources r_out ON r_out.id = bo.resource_id
+            )
+            SELECT * FROM io WHERE ratio > 10
+        ''', self.conn)
+
+        print(f"Extreme input/output ratios (>10:1): {len(extreme_ratios)}")
+        self._add_warnings('extreme_ratios', (
+            f"{row.building}: {row.input_resource} -> {row.output_resource} ({row.ratio:.1f}:1)"
+            for row in extreme_ratios.itertuples(index=False)))
+
+    # Per-map totals plus which maps lean on resources homed on other maps
+    def analyze_map_connectivity(self):
+        print("\n=== MAP CONNECTIVITY ===")
+
+        # Bucket by map with groupby instead of boxing every row into a Series
+        map_buildings = self.buildings.groupby(
+            self.buildings['map_name'].fillna('Unknown'))['name'].apply(list).to_dict()
+        map_resources = self.resources.groupby(
+            self.resources['map_name'].fillna('Unknown'))['name'].apply(list).to_dict()
+
+        for map_name in sorted(map_buildings):
+            print(f"  {map_name}: {len(map_buildings[map_name])} buildings, "
+                  f"{len(map_resources.get(map_name, []))} resources")
+
+        # One join answers "which buildings consume a resource homed on another map"
+        # for every ordered pair of maps at once, instead of a query per pair
+        cross_map = pd.read_sql('''
+            SELECT mb.name AS from_map, mr.name AS to_map,
+                   b.name AS building, r.name AS resource
+            FROM buildings b
+            JOIN building_inputs bi ON bi.building_id = b.id
+            JOIN resources r ON r.id = bi.resource_id
+            JOIN maps mb ON mb.id = b.map_id
+            JOIN maps mr ON mr.id = r.map_id
+            WHERE b.map_id <> r.map_id
+        ''', self.conn)
+
+        if cross_map.empty:
+            print("No cross-map dependencies found.")
+            return
+
+        dependencies = cross_map.groupby(['from_map', 'to_map']).apply(
+            lambda g: g[['building', 'resource']].to_dict('records'))
+        for (from_map, to_map), records in dependencies.items():
+            print(f"  {from_map} depends on {to_map} for {len(records)} inputs")
+            self._add_warnings('cross_map_dependencies',
+                              [f"{from_map} -> {to_map}: {len(records)} inputs"])
+
+    # Dump everything found to data_validation_report.json
+    def generate_report(self):
+        print("\n=== VALIDATION REPORT ===")
+
+        report = {
+            'timestamp': datetime.now(timezone.utc).isoformat(),
+            'summary': {
+                'total_issues': self._issue_count,
+                'total_warnings': self._warning_count,
+                'categories_with_issues': [k for k, v in self.issues.items() if v],
+            },
+            'issues': dict(self.issues),
+            'warnings': dict(self.warnings),
+        }
+
+        if orjson is not None:
+            with open('data_validation_report.json', 'wb') as f:
+                f.write(orjson.dumps(report, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY,
+                                     default=str))
+        else:
+            with open('data_validation_report.json', 'w') as f:
+                json.dump(report, f, indent=2, default=str)
+
+        print(f"Issues: {report['summary']['total_issues']}")
+        print(f"Warnings: {report['summary']['total_warnings']}")
+        print("Full report written to data_validation_report.json")
+
+def main():
+    validator = DataValidator()
+    validator.validate_building_connections()
+    validator.validate_construction_maintenance()
+    validator.validate_resource_chains()
+    validator.detect_calculation_breakers()
+    validator.analyze_map_connectivity()
+    validator.generate_report()
+
+if __name__ == "__main__":
+    main()
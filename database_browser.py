@@ -0,0 +1,74 @@
+"""
+Masterplan Tycoon Database Browser
+
+Author: Patrick Snyder
+
+Description:
+Quick look inside masterplan_tycoon_clean.db after a rebuild. Prints row counts per
+table, the maps, and then probes for a handful of well-known resources and buildings
+so you can eyeball whether the SoT import landed where it should have.
+
+Usage:
+- Build the database first (create_clean_database.py)
+- Run database_browser.py in python
+
+"""
+
+import pandas as pd
+
+from config import get_db_connection
+
+# Run every LIKE probe against one table in a single query; returns
+# {probe: [(name, map_name), ...]} with misses absent
+def _probe_names(conn, table, probes):
+    placeholders = ','.join('(?)' for _ in probes)
+    df = pd.read_sql(f'''
+        WITH p(pat) AS (VALUES {placeholders})
+        SELECT p.pat, t.name, m.name AS map_name
+        FROM p
+        JOIN {table} t ON t.name LIKE '%' || p.pat || '%'
+        JOIN maps m ON m.id = t.map_id
+    ''', conn, params=probes)
+    return {pat: list(zip(g['name'], g['map_name'])) for pat, g in df.groupby('pat')}
+
+# Print row counts, the maps, and spot-checks for names every playthrough has
+def check_database_contents():
+    conn = get_db_connection()
+
+    print("=== TABLE COUNTS ===")
+    tables = ['maps', 'plans', 'recipes', 'buildings', 'resource_categories', 'resources', 'recipe_buildings']
+    for table in tables:
+        count = pd.read_sql(f'SELECT COUNT(*) AS n FROM {table}', conn)['n'][0]
+        print(f"  {table}: {count} rows")
+
+    print("\n=== MAPS ===")
+    print(pd.read_sql('SELECT * FROM maps', conn).to_string(index=False))
+
+    # Resources any save should have -- if these don't resolve, the import is off.
+    # One query per section: the probes go in as a VALUES table and come back
+    # already matched, instead of a round-trip (and a tiny DataFrame) per probe.
+    print("\n=== COMMON RESOURCES ===")
+    common_resources = ['timber', 'stone', 'fish', 'wheat', 'iron', 'coal', 'planks']
+    matches = _probe_names(conn, 'resources', common_resources)
+    for resource in common_resources:
+        hits = matches.get(resource)
+        if hits is None:
+            print(f"  {resource}: NOT FOUND")
+        else:
+            print(f"  {resource}: " + ", ".join(f"{name} ({map_name})" for name, map_name in hits))
+
+    print("\n=== COMMON BUILDINGS ===")
+    common_buildings = ['sawmill', 'quarry', 'mine', 'farm', 'port', 'warehouse']
+    matches = _probe_names(conn, 'buildings', common_buildings)
+    for building in common_buildings:
+        hits = matches.get(building)
+        if hits is None:
+            print(f"  {building}: NOT FOUND")
+        else:
+            print(f"  {building}: {len(hits)} matches")
+
+def main():
+    check_database_contents()
+
+if __name__ == "__main__":
+    main()
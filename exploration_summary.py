@@ -0,0 +1,131 @@
+"""
+Masterplan Tycoon Exploration Summary
+
+Author: Patrick Snyder
+
+Description:
+Rolls up the reports the exploration scripts leave behind -- the validator's
+data_validation_report.json and the port analyzer's port_analysis_report.json --
+into one answer to the question that actually matters: is this data clean enough
+to build the production calculator on yet?
+
+Usage:
+- Run data_validator.py and port_analyzer.py first
+- Run exploration_summary.py in python
+
+"""
+
+import json
+import mmap
+import os
+
+# orjson parses a whole mmap'd buffer in one zero-copy pass, which leaves stdlib
+# json well behind once the reports grow; stdlib remains the fallback
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# ijson can stream just the subtrees the summary reads, skipping the bulky port
+# lists entirely (same optional dependency as data_io)
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+REPORT_FILES = {
+    'data_validation': 'data_validation_report.json',
+    'port_analysis': 'port_analysis_report.json',
+}
+
+# The readiness roll-up only ever reads these top-level keys; everything else in
+# the reports (the full port list especially) is dead weight for this script
+REPORT_KEYS = {
+    'data_validation': ['summary'],
+    'port_analysis': ['summary'],
+}
+
+# Stream only the named top-level keys out of one report file
+def load_report_subset(path, keys):
+    subset = {}
+    for key in keys:
+        with open(path, 'rb') as f:
+            value = next(ijson.items(f, key), None)
+        if value is not None:
+            subset[key] = value
+    return subset
+
+# Load whichever reports exist; missing ones just come back absent. When ijson is
+# available only the keys in REPORT_KEYS are parsed at all.
+def load_reports():
+    reports = {}
+    for name, path in REPORT_FILES.items():
+        if not os.path.exists(path):
+            print(f"Report not found: {path} (run the script that writes it first)")
+            continue
+        if ijson is not None:
+            reports[name] = load_report_subset(path, REPORT_KEYS[name])
+        elif orjson is not None:
+            # Parse straight off the memory-mapped bytes -- no read() copy, and
+            # orjson tokenizes the single slice far faster than a reader loop
+            with open(path, 'rb') as f:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    reports[name] = orjson.loads(mm[:])
+        else:
+            with open(path, 'r') as f:
+                reports[name] = json.load(f)
+    return reports
+
+# Boil both reports down to a go/no-go view for the calculator work
+def analyze_calculation_readiness(reports):
+    # pandas is only needed to format the blocker/caution table, so defer the
+    # (heavy) import until this actually runs rather than paying it at import time
+    import pandas as pd
+
+    print("=== CALCULATION READINESS ===")
+
+    blockers = []
+    cautions = []
+
+    data_report = reports.get('data_validation')
+    if data_report:
+        summary = data_report.get('summary', {})
+        issues = summary.get('total_issues', 0)
+        warnings = summary.get('total_warnings', 0)
+        print(f"Validation: {issues} issues, {warnings} warnings")
+        if issues:
+            blockers.append(f"{issues} data validation issues unresolved")
+        if warnings:
+            cautions.append(f"{warnings} validation warnings to review")
+
+    port_report = reports.get('port_analysis')
+    if port_report:
+        summary = port_report.get('summary', {})
+        risk_counts = summary.get('risk_counts', {})
+        print(f"Ports: {summary.get('total_ports', 0)} found, "
+              f"{summary.get('transport_chains', 0)} transport chains")
+        for category, count in risk_counts.items():
+            if count:
+                cautions.append(f"{count} {category.replace('_', ' ')} risks")
+
+    rows = [{'kind': 'BLOCKER', 'detail': b} for b in blockers]
+    rows += [{'kind': 'CAUTION', 'detail': c} for c in cautions]
+
+    print()
+    if not rows:
+        print("No blockers or cautions -- ready to build the calculator.")
+    else:
+        print(pd.DataFrame(rows).to_string(index=False))
+        if blockers:
+            print("\nNot ready yet: clear the blockers first.")
+        else:
+            print("\nReady with cautions: the calculator can start, watch the list above.")
+
+    return {'blockers': blockers, 'cautions': cautions}
+
+def main():
+    reports = load_reports()
+    analyze_calculation_readiness(reports)
+
+if __name__ == "__main__":
+    main()
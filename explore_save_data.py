@@ -0,0 +1,228 @@
+"""
+Masterplan Tycoon Save Data Explorer
+
+Author: Patrick Snyder
+
+Description:
+Walks a raw save export (game_data_save0.json) to see what the player actually
+built: how many of each node type, where they sit, what is flowing through
+their storages, and how the save's ConfigIDs line up with the building names
+in the clean database. The mapping is the interesting part -- the save speaks
+in ConfigIDs like 'construction.charcoal_kiln' while the database speaks in
+display names, and the calculator needs a bridge between the two.
+
+Usage:
+- Export a save as game_data_save0.json (see the save explorer scripts)
+- Build the clean database first (create_clean_database.py)
+- Run explore_save_data.py in python
+
+"""
+
+import json
+import os
+import sqlite3
+from collections import Counter
+
+import numpy as np
+import pandas as pd
+
+# orjson parses the whole save several times faster than stdlib json and
+# allocates fewer intermediate objects for the nested storage dicts
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# ijson streams the node list without materializing the whole save tree (same
+# optional dependency as data_io); stdlib json remains the fallback
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+SAVE_FILE = 'game_data_save0.json'
+DB_FILE = 'masterplan_tycoon_clean.db'
+
+# Parse the whole save file into memory (orjson wants the raw bytes)
+def load_save_file():
+    try:
+        if orjson is not None:
+            with open(SAVE_FILE, 'rb') as f:
+                return orjson.loads(f.read())
+        with open(SAVE_FILE, 'r') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        print(f"Save file not found: {SAVE_FILE}")
+        return None
+
+# Yield save nodes one at a time: streamed via ijson when available, otherwise
+# out of a full json.load of the file
+def _iter_nodes():
+    if ijson is not None:
+        with open(SAVE_FILE, 'rb') as f:
+            yield from ijson.items(f, 'Nodes.item')
+    else:
+        save_data = load_save_file()
+        yield from (save_data or {}).get('Nodes', [])
+
+# One streamed pass over the node list computing the type tally, positions,
+# construction details, and resource flows together. Fusing the two former
+# per-analysis loops means the save is parsed once and never held whole in
+# memory alongside the derived frames.
+def analyze_nodes_and_flows():
+    print("=== NODE ANALYSIS ===")
+
+    config_counts = Counter()
+    # Column-wise accumulators: each field appends to its own flat list, so the
+    # frame below is built straight from typed columns with no per-row record
+    # for pandas to transpose
+    node_ids = []
+    node_configs = []
+    xs = []
+    ys = []
+    construction_data = []
+    production_data = []
+
+    total_nodes = 0
+    for node in _iter_nodes():
+        total_nodes += 1
+        config_id = node.get('ConfigID', 'unknown')
+        config_counts[config_id] += 1
+        position = node.get('Position', {})
+        node_ids.append(node.get('ID'))
+        node_configs.append(config_id)
+        xs.append(position.get('X', 0.0))
+        ys.append(position.get('Y', 0.0))
+        if 'Construction' in node:
+            construction = node['Construction'] or {}
+            construction_data.append({
+                'ConfigID': config_id,
+                'uptime': construction.get('ProductionUptime', 0),
+            })
+            for item, amount in construction.get('OutcomeStorage', {}).items():
+                production_data.append({
+                    'ConfigID': config_id,
+                    'resource': item.split('.')[-1],
+                    'quantity': amount,
+                })
+
+    positions_df = pd.DataFrame({
+        'ID': node_ids,
+        'ConfigID': node_configs,
+        'X': np.asarray(xs, dtype=np.float64),
+        'Y': np.asarray(ys, dtype=np.float64),
+    }, copy=False)
+    production_df = pd.DataFrame(production_data)
+
+    print(f"Total nodes in save: {total_nodes}")
+    print(f"Distinct node types: {len(config_counts)}")
+    for config_id, count in config_counts.most_common(10):
+        print(f"  {config_id}: {count}")
+
+    print("\n=== RESOURCE FLOWS ===")
+    # One Cython hash-aggregate over the flattened frame replaces the per-item
+    # dict updates the loop used to do alongside everything else
+    if production_df.empty:
+        resource_counts = pd.Series(dtype='float64')
+    else:
+        resource_counts = production_df.groupby('resource')['quantity'].sum()
+    print(f"Resources seen in output storage: {len(resource_counts)}")
+    for resource, total in resource_counts.nlargest(10).items():
+        print(f"  {resource}: {total:,.0f}")
+
+    return config_counts, positions_df, construction_data, resource_counts, production_df
+
+# Rough categorization of node types by their ConfigID naming
+def analyze_building_types(config_counts):
+    print("\n=== BUILDING TYPES ===")
+
+    # Compiled string kernels scan the whole index per keyword, and np.select
+    # applies the same first-match priority the old per-config branches used
+    counts = pd.Series(config_counts)
+    idx = counts.index
+    masks = [
+        idx.str.contains('mission', regex=False),
+        idx.str.contains('storage', regex=False) | idx.str.contains('warehouse', regex=False),
+        (idx.str.contains('port', regex=False) | idx.str.contains('station', regex=False)
+         | idx.str.contains('dock', regex=False)),
+        idx.str.startswith('construction.'),
+    ]
+    category = np.select(masks, ['mission', 'storage', 'logistics', 'production'],
+                         default='other')
+    categories = counts.groupby(category).sum().to_dict()
+
+    for category_name, count in sorted(categories.items()):
+        print(f"  {category_name}: {count}")
+    return categories
+
+# Line save ConfigIDs up with the building names in the clean database
+def map_config_to_buildings(config_counts):
+    print("\n=== CONFIG -> DATABASE MAPPING ===")
+
+    conn = sqlite3.connect(DB_FILE)
+    db_buildings = pd.read_sql('''
+        SELECT b.name AS building_name, m.name AS map_name
+        FROM buildings b JOIN maps m ON m.id = b.map_id
+    ''', conn)
+    conn.close()
+
+    # Hoist the casefolding out of the matching loops: one vectorized lowercase
+    # pass over the database names, plus one hashed dict for the exact-name
+    # probes. The old approach re-lowercased every database row inside the
+    # per-config loop, comparing every (config, building) pair in Python.
+    db_lower = db_buildings['building_name'].str.lower().to_numpy()
+    name_to_row = {
+        lower: (orig, map_name)
+        for lower, orig, map_name in zip(
+            db_lower, db_buildings['building_name'], db_buildings['map_name'])
+    }
+    # Tokenize the database names once too; the keyword fallback was rebuilding
+    # these sets for every (config, building) pair
+    db_tokens = [set(lower.split()) for lower in db_lower]
+
+    mapped = {}
+    unmapped = []
+    for config_id, count in config_counts.items():
+        # 'construction.charcoal_kiln' -> 'charcoal kiln'
+        parts = config_id.split('.')
+        clean_config = (parts[1] if len(parts) > 1 else parts[0]).replace('_', ' ').lower()
+
+        # Strategy 1: exact name first -- an O(1) dict probe -- then substring
+        # containment either way over the precomputed lowercase array
+        hit = name_to_row.get(clean_config)
+        if hit is None:
+            for lower in db_lower:
+                if lower in clean_config or clean_config in lower:
+                    hit = name_to_row[lower]
+                    break
+
+        # Strategy 2: fall back to shared keyword tokens for the awkward names
+        if hit is None:
+            config_tokens = set(clean_config.split())
+            for lower, tokens in zip(db_lower, db_tokens):
+                if config_tokens & tokens:
+                    hit = name_to_row[lower]
+                    break
+
+        if hit is not None:
+            mapped[config_id] = {'building': hit[0], 'map': hit[1], 'count': count}
+        else:
+            unmapped.append(config_id)
+
+    print(f"Mapped {len(mapped)} of {len(config_counts)} node types to database buildings")
+    if unmapped:
+        print(f"Unmapped examples: {sorted(unmapped)[:5]}")
+    return mapped, unmapped
+
+def main():
+    if not os.path.exists(SAVE_FILE):
+        print(f"Save file not found: {SAVE_FILE}")
+        return
+
+    config_counts, positions_df, construction_data, resource_counts, production_df = \
+        analyze_nodes_and_flows()
+    analyze_building_types(config_counts)
+    map_config_to_buildings(config_counts)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+"""
+Masterplan Tycoon Database Inspector
+
+Author: Patrick Snyder
+
+Description:
+Dumps the shape of the clean database: every table with its columns, row
+count, and a peek at the first few rows. The quickest way to answer "did that
+load actually work" without reaching for a browser tool.
+
+Usage:
+- Run inspect_database.py in python
+
+"""
+
+import sqlite3
+
+DB_FILE = 'masterplan_tycoon_clean.db'
+
+# Print every table's columns, row count, and first few rows
+def inspect_database():
+    conn = sqlite3.connect(DB_FILE)
+    print("=== DATABASE INSPECTION ===")
+
+    tables = [name for (name,) in conn.execute(
+        "SELECT name FROM sqlite_master WHERE type='table' ORDER BY name")]
+    print(f"{len(tables)} tables\n")
+
+    # Plain cursor fetches all the way down: instantiating a DataFrame for a
+    # three-row peek costs an order of magnitude more than fetchmany on tuples
+    for table in tables:
+        count = conn.execute(f'SELECT COUNT(*) FROM {table}').fetchone()[0]
+        cursor = conn.execute(f'SELECT * FROM {table}')
+        columns = [c[0] for c in cursor.description]
+        print(f"{table} ({count} rows)")
+        print(f"  columns: {', '.join(columns)}")
+        for row in cursor.fetchmany(3):
+            print(f"  {row}")
+        print()
+
+    conn.close()
+
+def main():
+    inspect_database()
+
+if __name__ == "__main__":
+    main()
@@ -41,54 +41,14 @@ Future Ideas:
 
 """
 
-import os
-import getpass
 import tkinter as tk
 from tkinter import ttk
-import json
 from collections import Counter
 from datetime import datetime
 
-# Find the save file in the current user's directory
-def find_save_file():
-    
-    # Try to automatically set the username and save file path
-    # DON'T UPDATE THESE
-    username = getpass.getuser()  # Get current Windows username
-    save_dir = os.path.join('C:', 'Users', username, 'AppData', 'LocalLow', 'Bureau Bravin', 'Masterplan Tycoon')
-    save_file = os.path.join(save_dir, 'save_0.sav')
-    
-    
-    # CUSTOM username AND filepath
-    # If the script isn't running, you can hard code in your username, file path, and filename below
-    # Override username by uncommenting next line
-    #username = "myusername"
-    
-    # Override directory by uncommenting next line (be sure to use the "\\" escape character)
-    #save_dir = os.path("C:\\This\\is\\the\\custom\\file\\path")
-
-    # Override the target save file by uncommenting the next line (Slot 1 = save_0, Slot 2 = save_1, etc)
-    #save_file = os.path.join(save_dir, 'save_1.sav')
-    
-    # END User Configuration
-    
-    if os.path.exists(save_file):
-        return save_file
-    else:
-        print(f"Save file not found at {save_file}")
-        return None
-
-# Load the JSON data from the save file
-def load_save_data():
-    save_file = find_save_file()
-    
-    if save_file:
-        with open(save_file, 'r') as file:
-            data = json.load(file)
-        return data
-    else:
-        print("No save file found.")
-        return None
+# Save-file discovery and parsing now live in data_io so the dashboard and the console
+# analyzers share one cached loader (path overrides moved there too)
+from data_io import load_save_file
 
 def format_location_name(location_string):
     # Remove 'location.' prefix if it exists
@@ -193,7 +153,7 @@ class GameStatusGUI:
         self.tab_control.pack(expand=1, fill="both")
 
         # Load game data from sav_0.sav file dynamically based on user directory
-        self.data = load_save_data()
+        self.data = load_save_file()
 
         if self.data:
             # Display Player Statistics
@@ -0,0 +1,135 @@
+"""
+Masterplan Tycoon Mission Complexity Analyzer
+
+Author: Patrick Snyder
+
+Description:
+Missions are the spine of the game: each one asks for a pile of finished goods,
+and the real cost of a mission is the whole production chain hiding behind each
+turn-in. This script builds a directed graph of resource conversions out of the
+relationship tables, then walks upstream from the usual mission resources to
+measure how deep and wide each chain runs -- the numbers the calculator needs
+to rank missions by effort.
+
+Usage:
+- Build the database and relationship tables first
+- Run mission_complexity_analyzer.py in python
+
+"""
+
+from collections import defaultdict
+
+import networkx as nx
+
+from config import get_db_connection
+
+# The turn-ins that show up on mission lists across the campaign
+MISSION_RESOURCES = ['Tools', 'Planks', 'Bricks', 'Steel', 'Coal', 'Grain',
+                     'Fish', 'Clothes', 'Paper', 'Cement', 'Glass', 'Gold']
+
+# Build the resource conversion graph: an edge input -> output per building
+def build_production_graph(conn=None):
+    print("=== BUILDING PRODUCTION GRAPH ===")
+    if conn is None:
+        conn = get_db_connection()
+
+    # Raw fetchall instead of read_sql + iterrows: the edge assembly only needs
+    # plain tuples, and iterrows would box every cell back into a Python scalar
+    # one row at a time anyway
+    rows = conn.execute('''
+        SELECT b.name AS building, ri.name AS input_resource, bi.quantity AS input_qty,
+               ro.name AS output_resource, bo.quantity AS output_qty,
+               bo.output_per_minute, bo.production_time_seconds
+        FROM buildings b
+        JOIN building_inputs bi ON bi.building_id = b.id
+        JOIN resources ri ON ri.id = bi.resource_id
+        JOIN building_outputs bo ON bo.building_id = b.id
+        JOIN resources ro ON ro.id = bo.resource_id
+    ''').fetchall()
+
+    # One pass over the tuples builds the edge list and the per-building
+    # summary together; add_edges_from then inserts everything at C speed
+    G = nx.DiGraph()
+    edges = []
+    building_info = defaultdict(lambda: {'inputs': set(), 'outputs': set()})
+    for building, input_resource, input_qty, output_resource, output_qty, rate, time_s in rows:
+        edges.append((input_resource, output_resource,
+                      {'building': building, 'input_qty': input_qty,
+                       'output_qty': output_qty, 'production_rate': rate,
+                       'production_time': time_s}))
+        info = building_info[building]
+        info['inputs'].add(input_resource)
+        info['outputs'].add(output_resource)
+
+    G.add_nodes_from({r[1] for r in rows} | {r[3] for r in rows}, type='resource')
+    G.add_edges_from(edges)
+
+    print(f"Graph: {G.number_of_nodes()} resources, {G.number_of_edges()} conversions, "
+          f"{len(building_info)} buildings")
+    return G, dict(building_info)
+
+# Every node's full upstream set in one pass: reverse the graph and take the
+# transitive closure -- an O(V+E) topological DP -- instead of re-walking
+# overlapping chains per mission target. Production loops break the DAG
+# requirement, so cycles get condensed into super-nodes first and expanded
+# back to their member resources afterwards.
+def _dependency_closure(graph):
+    reversed_graph = graph.reverse(copy=False)
+    if nx.is_directed_acyclic_graph(reversed_graph):
+        tc = nx.transitive_closure_dag(reversed_graph)
+        return {n: set(tc.successors(n)) for n in tc.nodes}
+
+    condensed = nx.condensation(reversed_graph)
+    tc = nx.transitive_closure_dag(condensed)
+    scc_members = {scc: set(data['members']) for scc, data in condensed.nodes(data=True)}
+    closure = {}
+    for name, scc in condensed.graph['mapping'].items():
+        reachable = set(scc_members[scc])
+        for successor in tc.successors(scc):
+            reachable |= scc_members[successor]
+        reachable.discard(name)
+        closure[name] = reachable
+    return closure
+
+# Score each mission turn-in by how deep its production chain runs
+def analyze_mission_complexity(graph, building_info):
+    print("\n=== MISSION COMPLEXITY ===")
+
+    closure = _dependency_closure(graph)
+
+    # One set intersection decides which turn-ins the graph knows, instead of
+    # probing the adjacency dict inside the reporting loop
+    present = graph.nodes & set(MISSION_RESOURCES)
+    missing = [resource for resource in MISSION_RESOURCES if resource not in present]
+    if missing:
+        print(f"  Not in the production graph: {', '.join(missing)}")
+
+    complexity = {}
+    for resource in MISSION_RESOURCES:
+        if resource not in present:
+            continue
+        dependencies = closure[resource]
+        chain = dependencies | {resource}
+        buildings_used = {building for building, info in building_info.items()
+                          if info['outputs'] & chain}
+        complexity[resource] = {
+            'upstream_resources': len(dependencies),
+            'buildings': len(buildings_used),
+        }
+        print(f"  {resource}: {len(dependencies)} upstream resources "
+              f"via {len(buildings_used)} buildings")
+
+    ranked = sorted(complexity.items(),
+                    key=lambda kv: kv[1]['upstream_resources'], reverse=True)
+    if ranked:
+        print(f"\nDeepest chain: {ranked[0][0]} "
+              f"({ranked[0][1]['upstream_resources']} upstream resources)")
+    return complexity
+
+def main():
+    conn = get_db_connection()
+    graph, building_info = build_production_graph(conn)
+    analyze_mission_complexity(graph, building_info)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,282 @@
+"""
+Masterplan Tycoon Port Analyzer
+
+Author: Patrick Snyder
+
+Description:
+Ports are the odd ones out in the game data: they move resources between maps
+instead of producing them, so a calculator that treats them like normal production
+buildings gets the math wrong. This script digs into the clean database to find
+every transport-style building, work out which resources actually cross maps, trace
+the transport chains, and flag the spots where the calculation logic needs special
+handling.
+
+The findings are printed and written to port_analysis_report.json, which
+exploration_summary.py rolls up together with the validation report.
+
+Usage:
+- Build the database first (create_clean_database.py plus the relationship tables)
+- Run port_analyzer.py in python
+
+"""
+
+import json
+import re
+
+import pandas as pd
+
+# orjson writes the report several times faster than stdlib json and serializes
+# the numpy scalars pandas leaves in the records natively
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from config import get_db_connection
+
+# The transport vocabulary keeps growing as new building names show up in the SoT
+# sheets. The alternation compiles to one C-level automaton that scans every
+# keyword in a single pass per name, however long the list gets, and compiling at
+# import means nothing rebuilds it per call.
+TRANSPORT_KEYWORDS = ['port', 'dock', 'pier', 'harbor', 'ferry', 'wharf',
+                      'terminal', 'depot', 'station', 'crossing', 'landing']
+TRANSPORT_PATTERN = re.compile('|'.join(map(re.escape, TRANSPORT_KEYWORDS)))
+
+class PortAnalyzer:
+    def __init__(self):
+        self.conn = get_db_connection()
+        self.ports = []
+        self.transport_chains = []
+        self.transport_chains_df = None
+
+    # Find every building that looks like it moves resources rather than making them
+    def identify_ports(self):
+        print("=== IDENTIFYING PORTS ===")
+
+        buildings = pd.read_sql('''
+            SELECT b.id, b.name, m.name AS map_name
+            FROM buildings b JOIN maps m ON m.id = b.map_id
+        ''', self.conn)
+        # Lowercase the whole column once; every keyword check downstream reads
+        # this instead of re-lowercasing names
+        buildings['name_lower'] = buildings['name'].str.lower()
+
+        # One automaton pass over the name column replaces the per-row
+        # lowercase-and-check loop; only the matches get iterated afterwards
+        mask = buildings['name_lower'].str.contains(TRANSPORT_PATTERN, regex=True, na=False)
+        candidates = buildings.loc[mask]
+
+        print(f"Found {len(candidates)} transport-style buildings")
+        if candidates.empty:
+            self.ports = []
+            return self.ports, {}
+
+        # Pull every candidate's inputs/outputs/construction/maintenance rows in
+        # one UNION ALL statement with a kind column: a single parameterized plan,
+        # one streamed result set, and one pass bucketing rows per building --
+        # no per-building queries and no DataFrames for these tiny results
+        ids = tuple(int(i) for i in candidates['id'])
+        placeholders = ','.join('?' for _ in ids)
+        relations = (('inputs', 'building_inputs'), ('outputs', 'building_outputs'),
+                     ('construction', 'building_construction'), ('maintenance', 'building_maintenance'))
+        union_sql = ' UNION ALL '.join(
+            f'''SELECT x.building_id, '{field}' AS kind, r.name AS resource, x.quantity
+                FROM {table} x JOIN resources r ON r.id = x.resource_id
+                WHERE x.building_id IN ({placeholders})'''
+            for field, table in relations)
+        relation_rows = {field: {} for field, _ in relations}
+        for bid, kind, resource, quantity in self.conn.execute(union_sql, ids * len(relations)):
+            relation_rows[kind].setdefault(bid, []).append({'resource': resource, 'quantity': quantity})
+
+        self.ports = []
+        port_categories = {}
+        for building in candidates.itertuples(index=False):
+            bid = building.id
+            port_info = {
+                'id': bid,
+                'name': building.name,
+                'map': building.map_name,
+                'inputs': relation_rows['inputs'].get(bid, []),
+                'outputs': relation_rows['outputs'].get(bid, []),
+                'construction': relation_rows['construction'].get(bid, []),
+                'maintenance': relation_rows['maintenance'].get(bid, []),
+            }
+            self.ports.append(port_info)
+            port_categories.setdefault(building.map_name, []).append(building.name)
+
+        for map_name, names in sorted(port_categories.items()):
+            print(f"  {map_name}: {len(names)} transport buildings")
+
+        return self.ports, port_categories
+
+    # Which resources exist on more than one map, and who depends on whom for them
+    def analyze_cross_map_dependencies(self):
+        print("\n=== CROSS-MAP DEPENDENCIES ===")
+
+        # Let sqlite do the grouping and the multi-map filter; only resources that
+        # actually span maps come back, instead of every (resource, map) row being
+        # bucketed and filtered in a Python loop
+        multi_map = pd.read_sql('''
+            SELECT r.name AS resource_name,
+                   GROUP_CONCAT(DISTINCT m.name) AS maps,
+                   COUNT(DISTINCT m.id) AS nmaps
+            FROM resources r LEFT JOIN maps m ON m.id = r.map_id
+            GROUP BY r.name HAVING nmaps > 1
+        ''', self.conn)
+        cross_map_resources = dict(zip(multi_map['resource_name'], multi_map['maps'].str.split(',')))
+
+        print(f"Resources present on multiple maps: {len(cross_map_resources)}")
+
+        # Buildings consuming a resource that is homed on a different map
+        cross_dependencies = pd.read_sql('''
+            SELECT b.name AS building, mb.name AS building_map,
+                   r.name AS resource, mr.name AS resource_map
+            FROM buildings b
+            JOIN building_inputs bi ON bi.building_id = b.id
+            JOIN resources r ON r.id = bi.resource_id
+            JOIN maps mb ON mb.id = b.map_id
+            JOIN maps mr ON mr.id = r.map_id
+            WHERE b.map_id <> r.map_id
+        ''', self.conn)
+
+        if cross_dependencies.empty:
+            print("No cross-map dependencies found.")
+            return cross_map_resources, cross_dependencies
+
+        # The map-name columns repeat a handful of values thousands of times;
+        # hashed categoricals make the pair groupby group over small int codes
+        cross_dependencies = cross_dependencies.astype(
+            {'resource_map': 'category', 'building_map': 'category'})
+        map_pairs = (cross_dependencies.groupby(['resource_map', 'building_map'], observed=True)
+                     .size().reset_index(name='dependency_count'))
+        print("Dependencies between maps:")
+        for pair in map_pairs.itertuples(index=False):
+            print(f"  {pair.resource_map} -> {pair.building_map}: "
+                  f"{pair.dependency_count} dependencies")
+
+        return cross_map_resources, cross_dependencies
+
+    # Trace buildings that take a resource in and push the same one out
+    def detect_transport_chains(self):
+        print("\n=== TRANSPORT CHAINS ===")
+
+        potential_transport = pd.read_sql('''
+            SELECT b.name AS building, m.name AS map_name, r.name AS resource,
+                   bi.quantity AS input_qty, bo.quantity AS output_qty
+            FROM buildings b
+            JOIN maps m ON m.id = b.map_id
+            JOIN building_inputs bi ON bi.building_id = b.id
+            JOIN building_outputs bo ON bo.building_id = b.id AND bo.resource_id = bi.resource_id
+            JOIN resources r ON r.id = bi.resource_id
+        ''', self.conn)
+
+        # One guarded division over the whole frame instead of branching per row;
+        # the frame stays on self so the risk check can filter it vectorized too
+        potential_transport['efficiency'] = (
+            potential_transport['output_qty']
+            .div(potential_transport['input_qty'])
+            .where(potential_transport['input_qty'] > 0, 0.0)
+        )
+        self.transport_chains_df = potential_transport.rename(columns={'map_name': 'map'})
+        self.transport_chains = self.transport_chains_df.to_dict('records')
+
+        print(f"Found {len(self.transport_chains)} pass-through conversions")
+        return self.transport_chains
+
+    # The places where naive production math would go wrong
+    def identify_calculation_risks(self):
+        print("\n=== CALCULATION RISKS ===")
+
+        risks = {'circular_transport': [], 'extreme_rates': [], 'missing_port_logic': []}
+
+        # Pass-throughs that emit more than they take in would let a calculator
+        # conjure resources out of thin air: one boolean mask, records only for
+        # the (small) filtered slice
+        if self.transport_chains_df is not None and not self.transport_chains_df.empty:
+            over_unity = self.transport_chains_df['efficiency'] > 1.0
+            risks['circular_transport'] = self.transport_chains_df.loc[over_unity].to_dict('records')
+
+        extreme_rates = pd.read_sql('''
+            SELECT b.name AS building, r.name AS resource, bo.quantity
+            FROM building_outputs bo
+            JOIN buildings b ON b.id = bo.building_id
+            JOIN resources r ON r.id = bo.resource_id
+            WHERE bo.quantity > 1000
+        ''', self.conn)
+        risks['extreme_rates'] = [
+            f"{row.building}: {row.resource} x{row.quantity}"
+            for row in extreme_rates.itertuples(index=False)]
+
+        # Ports with a missing side can't be modeled as a flow at all
+        for port in self.ports:
+            if not port['inputs'] or not port['outputs']:
+                risks['missing_port_logic'].append(port['name'])
+
+        for category, entries in risks.items():
+            print(f"  {category}: {len(entries)}")
+
+        return risks
+
+    # Serialize the report dict to port_analysis_report.json
+    def _write_report(self, report):
+        if orjson is not None:
+            opt = orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+            with open('port_analysis_report.json', 'wb') as f:
+                f.write(orjson.dumps(report, option=opt, default=str))
+        else:
+            with open('port_analysis_report.json', 'w') as f:
+                json.dump(report, f, indent=2, default=str)
+
+        print("\nFull report written to port_analysis_report.json")
+
+    # Run everything and write port_analysis_report.json
+    def generate_port_analysis_report(self):
+        ports, port_categories = self.identify_ports()
+
+        # With no transport buildings every downstream step is a no-op pass over
+        # the whole database; write the trivially empty report and stop
+        if not ports:
+            report = {
+                'timestamp': pd.Timestamp.now().isoformat(),
+                'summary': {'total_ports': 0, 'cross_map_resources': 0,
+                            'transport_chains': 0, 'risk_counts': {}},
+                'ports': {'all_ports': [], 'by_map': {}},
+                'cross_map_resources': {},
+                'cross_dependencies': [],
+                'transport_chains': [],
+                'calculation_risks': {},
+            }
+            self._write_report(report)
+            return report
+
+        cross_map_resources, cross_dependencies = self.analyze_cross_map_dependencies()
+        transport_chains = self.detect_transport_chains()
+        calculation_risks = self.identify_calculation_risks()
+
+        report = {
+            'timestamp': pd.Timestamp.now().isoformat(),
+            'summary': {
+                'total_ports': len(ports),
+                'cross_map_resources': len(cross_map_resources),
+                'transport_chains': len(transport_chains),
+                'risk_counts': {k: len(v) for k, v in calculation_risks.items()},
+            },
+            'ports': {
+                'all_ports': ports,
+                'by_map': port_categories,
+            },
+            'cross_map_resources': cross_map_resources,
+            'cross_dependencies': cross_dependencies.to_dict('records'),
+            'transport_chains': transport_chains,
+            'calculation_risks': calculation_risks,
+        }
+
+        self._write_report(report)
+        return report
+
+def main():
+    analyzer = PortAnalyzer()
+    analyzer.generate_port_analysis_report()
+
+if __name__ == "__main__":
+    main()
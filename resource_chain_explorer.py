@@ -0,0 +1,135 @@
+"""
+Masterplan Tycoon Resource Chain Explorer
+
+Author: Patrick Snyder
+
+Description:
+Quick lookups against the clean database for one thing at a time: who makes a
+resource and who eats it, what a single building consumes and produces, and
+what lives on a given map. Handy while sanity-checking the calculator math
+against what the game actually shows.
+
+Usage:
+- Build the database and relationship tables first
+- Run resource_chain_explorer.py in python, or import the get_* helpers
+
+"""
+
+import sqlite3
+from itertools import groupby
+from operator import itemgetter
+
+DB_FILE = 'masterplan_tycoon_clean.db'
+
+# One shared read connection for every helper: connection setup, PRAGMA reload,
+# and SQLite's per-connection statement cache are paid once per process instead
+# of once per lookup
+_CONN = sqlite3.connect(DB_FILE, check_same_thread=False)
+_CONN.execute('PRAGMA journal_mode=WAL')
+_CONN.execute('PRAGMA cache_size=-65536')
+
+# Who produces a resource, who consumes it, and what the producers need
+def get_resource_chain(resource_name):
+    conn = _CONN
+    print(f"=== RESOURCE CHAIN: {resource_name} ===")
+
+    # Raw cursor fetches for these small display queries: no DataFrame
+    # allocation or dtype inference for results this size
+    producers = conn.execute('''
+        SELECT b.name, m.name, bo.quantity, bo.output_per_minute
+        FROM building_outputs bo
+        JOIN buildings b ON b.id = bo.building_id
+        JOIN maps m ON m.id = b.map_id
+        JOIN resources r ON r.id = bo.resource_id
+        WHERE r.name = ?
+    ''', (resource_name,)).fetchall()
+    print(f"\nProduced by {len(producers)} buildings:")
+    for building, map_name, quantity, per_minute in producers:
+        print(f"  {building} ({map_name}): x{quantity}, {per_minute}/min")
+
+    consumers = conn.execute('''
+        SELECT b.name, m.name, bi.quantity
+        FROM building_inputs bi
+        JOIN buildings b ON b.id = bi.building_id
+        JOIN maps m ON m.id = b.map_id
+        JOIN resources r ON r.id = bi.resource_id
+        WHERE r.name = ?
+    ''', (resource_name,)).fetchall()
+    print(f"\nConsumed by {len(consumers)} buildings:")
+    for building, map_name, quantity in consumers:
+        print(f"  {building} ({map_name}): x{quantity}")
+
+    # Every producer's inputs come back from one four-way join ordered by
+    # building; groupby buckets the rows per producer instead of issuing a
+    # building-id lookup plus an inputs query for each one
+    upstream = conn.execute('''
+        SELECT b.name, r2.name AS input_name, bi.quantity
+        FROM building_outputs bo
+        JOIN buildings b ON b.id = bo.building_id
+        JOIN resources r ON r.id = bo.resource_id
+        JOIN building_inputs bi ON bi.building_id = b.id
+        JOIN resources r2 ON r2.id = bi.resource_id
+        WHERE r.name = ?
+        ORDER BY b.name
+    ''', (resource_name,)).fetchall()
+    print("\nUpstream dependencies:")
+    for building, rows in groupby(upstream, key=itemgetter(0)):
+        needs = ', '.join(f"{input_name} x{quantity}" for _, input_name, quantity in rows)
+        print(f"  {building} needs: {needs}")
+
+# Everything the database knows about one building
+def get_building_analysis(building_name):
+    conn = _CONN
+    print(f"\n=== BUILDING: {building_name} ===")
+
+    building = conn.execute('''
+        SELECT b.id, m.name, b.recipe_name, b.tier
+        FROM buildings b JOIN maps m ON m.id = b.map_id
+        WHERE b.name = ?
+    ''', (building_name,)).fetchone()
+    if building is None:
+        print("  Not found in the database")
+        return
+    building_id, map_name, recipe_name, tier = building
+    print(f"  Map: {map_name}, recipe: {recipe_name}, tier: {tier}")
+
+    for label, table in (('Inputs', 'building_inputs'),
+                         ('Outputs', 'building_outputs'),
+                         ('Construction', 'building_construction'),
+                         ('Maintenance', 'building_maintenance')):
+        rows = conn.execute(f'''
+            SELECT r.name, x.quantity
+            FROM {table} x JOIN resources r ON r.id = x.resource_id
+            WHERE x.building_id = ?
+        ''', (building_id,)).fetchall()
+        if rows:
+            items = ', '.join(f"{resource} x{quantity}" for resource, quantity in rows)
+            print(f"  {label}: {items}")
+
+# Counts and a sample of what sits on one map
+def get_map_overview(map_name):
+    conn = _CONN
+    print(f"\n=== MAP: {map_name} ===")
+
+    building_count, resource_count = conn.execute('''
+        SELECT (SELECT COUNT(*) FROM buildings b
+                JOIN maps m ON m.id = b.map_id WHERE m.name = ?),
+               (SELECT COUNT(*) FROM resources r
+                JOIN maps m ON m.id = r.map_id WHERE m.name = ?)
+    ''', (map_name, map_name)).fetchone()
+    print(f"  {building_count} buildings, {resource_count} resources")
+
+    for (name,) in conn.execute('''
+        SELECT b.name FROM buildings b
+        JOIN maps m ON m.id = b.map_id
+        WHERE m.name = ? ORDER BY b.tier LIMIT 10
+    ''', (map_name,)).fetchall():
+        print(f"  {name}")
+
+def main():
+    get_resource_chain('Planks')
+    get_building_analysis('Sawmill')
+    get_map_overview('Master')
+
+if __name__ == "__main__":
+    main()